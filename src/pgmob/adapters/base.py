@@ -1,4 +1,4 @@
-from typing import Any, Sequence, Union
+from typing import Any, Iterable, Sequence, Union
 from abc import abstractmethod, ABC
 from ..sql import Composable
 
@@ -126,6 +126,29 @@ class BaseCursor(ABC):
         else:
             return None
 
+    def fetchmany(self, size: int) -> list:
+        """Fetch the next set of rows. Adapters should override this method when the underlying
+        module can fetch several rows at once.
+
+        Args:
+            size (int): maximum number of rows to fetch
+
+        Returns:
+            list: up to `size` rows of the ResultSet. An empty list when no more rows are available.
+
+        Raises:
+            NoResultsToFetch: when there are no rows to fetch
+            ProgrammingError: when postgres returned an error
+            AdapterError: any other Adapter-related error
+        """
+        rows = []
+        for _ in range(size):
+            row = self.fetchone()
+            if row is None:
+                break
+            rows.append(row)
+        return rows
+
     def __enter__(self):
         return self
 
@@ -184,6 +207,28 @@ class BaseLargeObject(ABC):
 
     # default implementations
 
+    def write_from(self, chunks: Iterable[bytes], buffer_size: int = 32768) -> int:
+        """Write large object from an iterable of byte chunks. Small chunks are accumulated
+        and sent in writes of at least `buffer_size` bytes.
+
+        Args:
+            chunks (Iterable[bytes]): data chunks to write in order
+            buffer_size (int): minimum size of a single write, except the last one
+
+        Returns:
+            int: number of bytes written
+        """
+        written = 0
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= buffer_size:
+                written += self.write(bytes(buffer))
+                buffer.clear()
+        if buffer:
+            written += self.write(bytes(buffer))
+        return written
+
     def __enter__(self):
         return self
 
@@ -249,6 +294,17 @@ class BaseAdapter(ABC):
 
     # shared methods
 
+    def named_cursor(self, name: str) -> BaseCursor:
+        """Retrieve a server-side cursor object. Not all adapters support server-side cursors.
+
+        Args:
+            name (str): server-side cursor name
+
+        Raises:
+            NotImplementedError: when the adapter does not support server-side cursors
+        """
+        raise NotImplementedError()
+
     def get_connection(self) -> Any:
         """Retrieve current connection"""
         return self.connection
@@ -67,9 +67,29 @@ class Psycopg2Cursor(BaseCursor):
         """
         self._try_exec(lambda: self.cursor.execute(self._convert_query(query), params))
 
-    def executemany(self, query: Union[Composable, str], params: Sequence[tuple] = None) -> None:
-        """Execute a query with multiple parameter sets"""
-        self._try_exec(lambda: self.cursor.executemany(self._convert_query(query), params))
+    def executemany(
+        self, query: Union[Composable, str], params: Sequence[tuple] = None, page_size: Optional[int] = None
+    ) -> None:
+        """Execute a query with multiple parameter sets
+
+        Args:
+            query (Union[Composable, str]): query object or string
+            params (Sequence[tuple]): a sequence of query parameter tuples
+            page_size (Optional[int]): when specified, parameter sets are sent to the server in pages
+                of this many statements joined with ``;`` instead of one statement per round-trip.
+                In that case ``rowcount`` only reflects the last page, and the query must not end with
+                a ``--`` comment.
+        """
+        if page_size is None:
+            self._try_exec(lambda: self.cursor.executemany(self._convert_query(query), params))
+        else:
+            if params is None:
+                raise TypeError("params must be a sequence of parameter tuples")
+            self._try_exec(
+                lambda: psycopg2.extras.execute_batch(
+                    self.cursor, self._convert_query(query), params, page_size=page_size
+                )
+            )
 
     def mogrify(self, query: Union[Composable, str], params: tuple = None) -> bytes:
         """Returns a parsed SQL query based on the parameters provided
@@ -87,6 +107,17 @@ class Psycopg2Cursor(BaseCursor):
         """
         return self._try_exec(lambda: self.cursor.fetchall())
 
+    def fetchmany(self, size: int) -> list:
+        """Fetch the next set of rows
+
+        Args:
+            size (int): maximum number of rows to fetch
+
+        Returns:
+            list: up to `size` rows of the ResultSet.
+        """
+        return self._try_exec(lambda: self.cursor.fetchmany(size))
+
     def fetchone(self) -> Any:
         """Fetch one row
 
@@ -175,6 +206,14 @@ class Psycopg2Adapter(BaseAdapter):
         """Retrieve the cursor object using the current connection"""
         return Psycopg2Cursor(connection=self.connection, cursor_factory=self._cursor_factory)
 
+    def named_cursor(self, name: str) -> Psycopg2Cursor:
+        """Retrieve a server-side cursor object using the current connection
+
+        Args:
+            name (str): server-side cursor name
+        """
+        return Psycopg2Cursor(connection=self.connection, name=name, cursor_factory=self._cursor_factory)
+
     def lobject(self, oid: int, mode: str) -> Psycopg2LargeObject:
         """Retrieve the large object handler using the current connection
 
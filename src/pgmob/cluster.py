@@ -9,7 +9,7 @@ server using the adapter, such as ``psycopg2``. A connected Cluster object gives
 - Run backup/restore operations
 """
 import logging
-from typing import Any, Callable, List, Optional, Tuple, Union
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Union
 
 from .os import _BaseShellEnv, ShellEnv, OSCommandResult
 from ._decorators import RefreshProperty, LAZY_PREFIX, get_lazy_property
@@ -228,6 +228,64 @@ class Cluster(object):
 
         return self.execute_with_cursor(execute_task)
 
+    def _execute_stream(
+        self,
+        query: Union[Composable, str],
+        params: Union[Tuple[Any], Any] = None,
+        name: str = "pgmob_stream",
+        size: int = 1000,
+    ) -> Iterator[Tuple[Any]]:
+        """Execute a query using a server-side cursor and yield the rows, fetching them from the server
+        in batches. Keeps memory usage flat on large resultsets, such as catalog-wide scans.
+
+        Server-side cursors only live within a transaction, so the rows are streamed only when the
+        adapter supports named cursors, autocommit is on and no transaction is open. Otherwise the query
+        is executed with :meth:`execute`, leaving any pending work of the caller untouched.
+
+        Args:
+            query (Union[Composable, str]): Query text or a Composable object
+            params (Union[Tuple[Any], Any]): Tuple of parameter values (or a single value)
+            name (str): server-side cursor name
+            size (int): number of rows to retrieve from the server at once
+
+        Returns:
+            Iterator[Tuple[Any]]: rows returned from the server
+        """
+        if not self._validate_connection():
+            raise PostgresError("Connection is not open")
+        adapter = self.adapter
+        cursor: Optional[BaseCursor] = None
+        if adapter.get_autocommit() and not adapter.is_in_transaction:
+            try:
+                cursor = adapter.named_cursor(name)
+            except NotImplementedError:
+                pass
+        if cursor is None:
+            yield from self.execute(query, params)
+            return
+        LOGGER.debug("Executing query with a server-side cursor: %s", query)
+        if params:
+            param_set = params if isinstance(params, tuple) else tuple([params])
+        else:
+            param_set = None
+        adapter.set_autocommit(False)
+        try:
+            with cursor:
+                cursor.execute(query, param_set)
+                while True:
+                    rows = cursor.fetchmany(size)
+                    yield from rows
+                    if len(rows) < size:
+                        break
+        except BaseException:
+            # also covers the consumer abandoning the generator halfway through
+            adapter.rollback()
+            raise
+        else:
+            adapter.commit()
+        finally:
+            adapter.set_autocommit(True)
+
     def terminate(
         self,
         all_connections: bool = None,
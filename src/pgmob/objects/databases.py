@@ -53,8 +53,7 @@ class Database(generic._DynamicObject, generic._CollectionChild):
         oid: Optional[int] = None,
         from_template: str = None,
     ):
-        super().__init__(cluster=cluster, name=name, kind="DATABASE", oid=oid)
-        generic._CollectionChild.__init__(self, parent=parent)
+        super().__init__(cluster=cluster, name=name, kind="DATABASE", oid=oid, parent=parent)
         self._owner = owner
         self._encoding = encoding
         self._collation = collation
@@ -250,7 +249,9 @@ class Database(generic._DynamicObject, generic._CollectionChild):
 class _DatabaseMapper(generic._BaseObjectMapper[Database]):
     """Maps out a resultset from a database query to a database object"""
 
-    attributes = [
+    __slots__ = ()
+
+    attributes = (
         "name",
         "owner",
         "encoding",
@@ -265,7 +266,7 @@ class _DatabaseMapper(generic._BaseObjectMapper[Database]):
         "tablespace",
         "acl",
         "oid",
-    ]
+    )
 
 
 class DatabaseCollection(generic._BaseCollection[Database]):
@@ -281,9 +282,11 @@ class DatabaseCollection(generic._BaseCollection[Database]):
         super().refresh()
         sql = util.get_sql("get_database")
         result = self.cluster.execute(sql)
-        for mapper in [_DatabaseMapper(x) for x in result]:
-            self[mapper["name"]] = mapper.map(
-                Database(cluster=self.cluster, name=mapper["name"], parent=self, oid=mapper["oid"])
+        get_field, map_row = _DatabaseMapper.get_field, _DatabaseMapper.map_row
+        for row in result:
+            name = get_field(row, "name")
+            self[name] = map_row(
+                Database(cluster=self.cluster, name=name, parent=self, oid=get_field(row, "oid")), row
             )
 
     def new(
@@ -2,7 +2,9 @@
 
 from abc import abstractmethod
 from enum import Enum
+from functools import lru_cache
 import re
+import sys
 from typing import Any, Dict, Generic, Iterator, List, Optional, TYPE_CHECKING, Tuple, TypeVar
 from pgmob import errors
 from pgmob._decorators import deprecated
@@ -15,6 +17,11 @@ if TYPE_CHECKING:
 T = TypeVar("T")
 
 
+def _intern(value: Any) -> Any:
+    """Interns string values, leaving any other value intact"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 class _BasePostgresObject(object):
     """Base class for any Postgres object with oid.
 
@@ -25,7 +32,10 @@ class _BasePostgresObject(object):
         oid (Optional[int]): object id
     """
 
-    def __init__(self, oid: Optional[int] = None):
+    __slots__ = ("_oid",)
+
+    def __init__(self, oid: Optional[int] = None, **kwargs: Any):
+        super().__init__(**kwargs)
         self._oid = oid
 
     # properties
@@ -44,17 +54,46 @@ class _BasePostgresObject(object):
         return self._oid is None or self._oid <= 0
 
 
+# attributes that define the fully qualified name of an object
+_IDENTITY_ATTRS = ("name", "schema")
+
+
 class _BaseObjectMapper(Generic[T]):
     """Maps the resultset to a Dynamic Object"""
 
-    attributes: List[str] = []
-    exclude: List[str] = []
+    __slots__ = ("definition",)
+
+    attributes: Tuple[str, ...] = ()
+    exclude: Tuple[str, ...] = ()
+    # low-cardinality attributes shared by many objects, such as schema or owner names
+    interned: Tuple[str, ...] = ()
+    _effective_attrs: Tuple[str, ...] = ()
+    _positions: Dict[str, int] = {}
 
     def __init__(self, definition: tuple):
         self.definition = definition
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._effective_attrs = tuple(a for a in cls.attributes if a not in cls.exclude)
+        cls._positions = {a: i for i, a in enumerate(cls.attributes)}
+        # generate a straight-line map_row for the subclass attributes to avoid
+        # looping over attribute names and building attribute strings for every row
+        lines = ["def map_row(cls, obj, definition):"]
+        for attr in cls._effective_attrs:
+            value = f"definition[{cls._positions[attr]}]"
+            if attr in cls.interned:
+                value = f"_intern({value})"
+            lines.append(f"    obj._{attr} = {value}")
+        if any(a in _IDENTITY_ATTRS for a in cls._effective_attrs):
+            lines.append("    obj._sync_fqn()")
+        lines.append("    return obj")
+        namespace: Dict[str, Any] = {"_intern": _intern}
+        exec("\n".join(lines), namespace)
+        setattr(cls, "map_row", classmethod(namespace["map_row"]))
+
     def __getitem__(self, key: str) -> object:
-        return self.definition[self.attributes.index(key)]
+        return self.get_field(self.definition, key)
 
     def map(self, obj: T) -> T:
         """Assigns attributes to the Postgres object based on the definition resultset
@@ -63,18 +102,58 @@ class _BaseObjectMapper(Generic[T]):
         Args:
             obj (_BasePostgresObject): Postgres object
         """
-        for i in range(len(self.attributes)):
-            if self.attributes[i] not in self.exclude:
-                setattr(obj, f"_{self.attributes[i]}", self.definition[i])
+        return self.map_row(obj, self.definition)
+
+    @classmethod
+    def get_field(cls, definition: tuple, key: str) -> Any:
+        """Returns a single field from a resultset row without instantiating a mapper.
+
+        Args:
+            definition (tuple): resultset row
+            key (str): attribute name
+        """
+        return definition[cls._positions[key]]
+
+    @classmethod
+    def map_row(cls, obj: T, definition: tuple) -> T:
+        """Assigns attributes to the Postgres object based on a single resultset row
+        without instantiating a mapper and returns the object.
+
+        Args:
+            obj (_BasePostgresObject): Postgres object
+            definition (tuple): resultset row
+        """
+        for attr in cls._effective_attrs:
+            value = definition[cls._positions[attr]]
+            setattr(obj, f"_{attr}", _intern(value) if attr in cls.interned else value)
+        if any(a in _IDENTITY_ATTRS for a in cls._effective_attrs):
+            obj._sync_fqn()  # type: ignore[attr-defined]
 
         return obj
 
 
+_CLUSTER_CLASS: Optional[type] = None
+
+
+def _cluster_class() -> type:
+    """Resolves the Cluster class on first use: the cluster module imports this one"""
+    global _CLUSTER_CLASS
+    if _CLUSTER_CLASS is None:
+        from ..cluster import Cluster
+
+        _CLUSTER_CLASS = Cluster
+    return _CLUSTER_CLASS
+
+
 class _ClusterBound(object):
     """Object that is attached to a Cluster. Implements cluster retrieval internal function"""
 
-    def __init__(self, cluster: "Cluster" = None):
-        self._cluster = cluster
+    # also mixed into dict and list based collections, so the _cluster slot is declared by subclasses
+    __slots__ = ()
+
+    def __init__(self, cluster: "Cluster" = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._cluster = cluster  # type: ignore[misc]
 
     @property
     def cluster(self) -> "Cluster":
@@ -94,11 +173,9 @@ class _ClusterBound(object):
         Args:
             value (Cluster): Postgres cluster object
         """
-        from ..cluster import Cluster
-
-        if value is not None and not isinstance(value, Cluster):
+        if value is not None and not isinstance(value, _cluster_class()):
             raise ValueError("%s is not a cluster object", value.__class__)
-        self._cluster = value
+        self._cluster = value  # type: ignore[misc]
 
 
 class Fqn(object):
@@ -128,6 +205,8 @@ class Fqn(object):
 class _FqnObject(_BasePostgresObject, _ClusterBound):
     """Base Postgres object that has FQN, bound to a cluster and supports ephemeral changes"""
 
+    __slots__ = ("_cluster", "_fqn", "_fqn_cache", "_name", "_schema", "_kind")
+
     def __init__(
         self,
         kind: str,
@@ -135,10 +214,11 @@ class _FqnObject(_BasePostgresObject, _ClusterBound):
         oid: Optional[int] = None,
         schema: Optional[str] = None,
         cluster: "Cluster" = None,
+        **kwargs: Any,
     ):
-        _BasePostgresObject.__init__(self, oid=oid)
-        _ClusterBound.__init__(self, cluster=cluster)
+        super().__init__(oid=oid, cluster=cluster, **kwargs)
         self._fqn = Fqn(name=name, schema=schema)
+        self._fqn_cache: Optional[Composable] = None
         self._name = name
         self._schema = schema
         self._kind = kind
@@ -159,8 +239,18 @@ class _FqnObject(_BasePostgresObject, _ClusterBound):
         name = (f"{self.schema}." if self.schema and self.schema != "public" else "") + self.name
         return f"{self.__class__.__name__}('{name}')"
 
+    def _sync_fqn(self):
+        """Points the FQN to the current name and schema once those were loaded from the server.
+        Keeps the cached identifier when nothing has changed."""
+        if self._fqn.name != self._name or self._fqn.schema != self._schema:
+            self._fqn = Fqn(name=self._name, schema=self._schema)
+            self._fqn_cache = None
+
     def _sql_fqn(self) -> Composable:
-        return self._fqn.get_identifier()
+        # _fqn points to the object on the server and only changes along with it
+        if self._fqn_cache is None:
+            self._fqn_cache = self._fqn.get_identifier()
+        return self._fqn_cache
 
 
 class _DynamicObject(_FqnObject):
@@ -168,6 +258,8 @@ class _DynamicObject(_FqnObject):
     that support property change with an eventual .alter() call.
     """
 
+    __slots__ = ("_changes",)
+
     def __init__(
         self,
         kind: str,
@@ -175,8 +267,9 @@ class _DynamicObject(_FqnObject):
         oid: Optional[int] = None,
         schema: Optional[str] = None,
         cluster: "Cluster" = None,
+        **kwargs: Any,
     ):
-        super().__init__(kind=kind, name=name, schema=schema, cluster=cluster, oid=oid)
+        super().__init__(kind=kind, name=name, schema=schema, cluster=cluster, oid=oid, **kwargs)
         self._changes = _ChangeCollection()
 
     def alter(self):
@@ -193,21 +286,26 @@ class _DynamicObject(_FqnObject):
         self._changes = _ChangeCollection()
 
 
+_EPHEMERAL_ATTR_STATEMENTS = dict(
+    owner="ALTER {kind} {{fqn}} OWNER TO {{value}}",
+    name="ALTER {kind} {{fqn}} RENAME TO {{value}}",
+    schema="ALTER {kind} {{fqn}} SET SCHEMA {{value}}",
+    tablespace="ALTER {kind} {{fqn}} SET TABLESPACE {{value}}",
+)
+
+
+@lru_cache(maxsize=None)
+def _ephemeral_attr_sql(kind: str, attr: str) -> SQL:
+    """Returns a reusable ALTER template for an attribute of an object kind"""
+    return SQL(_EPHEMERAL_ATTR_STATEMENTS[attr].format(kind=kind))
+
+
 def _set_ephemeral_attr(obj: _DynamicObject, attr: str, value: Any):
-    params = dict(
-        fqn=obj._sql_fqn(),
-        value=Identifier(value),
-    )
-    stmt_map = dict(
-        owner=SQL(f"ALTER {obj._kind} {{fqn}} OWNER TO {{value}}").format(**params),
-        name=SQL(f"ALTER {obj._kind} {{fqn}} RENAME TO {{value}}").format(**params),
-        schema=SQL(f"ALTER {obj.kind} {{fqn}} SET SCHEMA {{value}}").format(**params),
-        tablespace=SQL(f"ALTER {obj.kind} {{fqn}} SET TABLESPACE {{value}}").format(**params),
-    )
-
-    if getattr(obj, f"_{attr}") != value:
-        obj._changes[attr] = _SQLChange(obj=obj, sql=stmt_map[attr])
-        setattr(obj, f"_{attr}", value)
+    if getattr(obj, f"_{attr}") == value:
+        return
+    sql = _ephemeral_attr_sql(obj._kind, attr).format(fqn=obj._sql_fqn(), value=Identifier(value))
+    obj._changes[attr] = _SQLChange(obj=obj, sql=sql)
+    setattr(obj, f"_{attr}", value)
 
 
 class MappedCollection(Dict[str, T]):
@@ -272,8 +370,12 @@ class _BaseCollection(_ClusterBound, SortedMappedCollection[T]):
 class _CollectionChild(object):
     """Defines an object belonging to a Postgres collection"""
 
-    def __init__(self, parent: _BaseCollection = None):
-        self._parent = parent
+    # the _parent slot is declared by subclasses to avoid a layout conflict with _DynamicObject
+    __slots__ = ()
+
+    def __init__(self, parent: _BaseCollection = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._parent = parent  # type: ignore[misc]
 
     @property
     def parent(self) -> Optional[_BaseCollection]:
@@ -14,6 +14,9 @@ if TYPE_CHECKING:
     from ..cluster import Cluster
 
 
+_IPV4_MASK_RE = re.compile(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}")
+
+
 class HBARule(str):
     """A record in pg_hba.conf file.
     Whitespace is considered equal upon object comparison.
@@ -35,6 +38,9 @@ class HBARule(str):
         field_map = {}
         auth_options: List[str] = []
         for i in range(len(fields)):
+            if name in field_map:
+                # fields are never reassigned once set, no need to parse the rest of the line
+                break
             if fields[i].startswith("#"):
                 # anything after is a comment
                 break
@@ -56,7 +62,7 @@ class HBARule(str):
             if i == 4:
                 if field_map["type"] == "local":
                     auth_options.append(fields[i])
-                elif re.match("\\d{1,3}\.\\d{1,3}\.\\d{1,3}\\.\\d{1,3}", fields[i]):
+                elif _IPV4_MASK_RE.match(fields[i]):
                     field_map["mask"] = fields[i]
                 else:
                     field_map["auth_method"] = fields[i]
@@ -1,5 +1,5 @@
 """Postgresql largeobject objects"""
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 from pgmob.sql import SQL, Literal
 from pgmob.adapters.base import BaseLargeObject
 from pgmob.errors import *
@@ -33,8 +33,7 @@ class LargeObject(generic._DynamicObject, generic._CollectionChild):
         owner: str = None,
     ):
         """Initialize a new LargeObject object"""
-        super().__init__(kind="LARGE OBJECT", cluster=cluster, oid=oid, name=str(oid))
-        generic._CollectionChild.__init__(self, parent=parent)
+        super().__init__(kind="LARGE OBJECT", cluster=cluster, oid=oid, name=str(oid), parent=parent)
         self._owner = owner
 
     def _sql_fqn(self) -> Literal:
@@ -89,6 +88,25 @@ class LargeObject(generic._DynamicObject, generic._CollectionChild):
 
         self._with_lobject(task, mode="w")
 
+    def write_from(self, chunks: Iterable[bytes], truncate: bool = True):
+        """Overwrites Large object contents from an iterable of byte chunks, without
+        assembling the whole object in memory. Chunks are buffered into larger writes.
+
+        Args:
+            chunks(Iterable[bytes]): Large Object contents split into chunks
+            truncate(bool): Whether to truncate the object before write. Default = True
+        """
+
+        def task(lob: BaseLargeObject):
+            try:
+                if truncate:
+                    lob.truncate()
+                lob.write_from(chunks)
+            finally:
+                lob.close()
+
+        self._with_lobject(task, mode="w")
+
     def read(self, mode="t"):
         """Read Large object contents
 
@@ -119,10 +137,12 @@ class LargeObject(generic._DynamicObject, generic._CollectionChild):
 class _LargeObjectMapper(generic._BaseObjectMapper[LargeObject]):
     """Maps out a resultset from a database query to a large object"""
 
-    attributes = [
+    __slots__ = ()
+
+    attributes = (
         "oid",
         "owner",
-    ]
+    )
 
 
 class LargeObjectCollection(generic._BaseCollection[LargeObject]):
@@ -138,8 +158,9 @@ class LargeObjectCollection(generic._BaseCollection[LargeObject]):
 
         super().refresh()
         sql = util.get_sql("get_large_object")
-        result = self.cluster.execute(sql)
-        for mapper in [_LargeObjectMapper(x) for x in result]:
-            self[mapper["oid"]] = mapper.map(
-                LargeObject(cluster=self.cluster, oid=mapper["oid"], parent=self)
-            )
+        # a database can hold any number of large objects, stream them from the server
+        result = self.cluster._execute_stream(sql, name="pgmob_large_objects")
+        get_field, map_row = _LargeObjectMapper.get_field, _LargeObjectMapper.map_row
+        for row in result:
+            oid = get_field(row, "oid")
+            self[oid] = map_row(LargeObject(cluster=self.cluster, oid=oid, parent=self), row)
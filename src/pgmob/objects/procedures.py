@@ -10,6 +10,9 @@ if TYPE_CHECKING:
     from ..cluster import Cluster
 
 
+_SQL_CASCADE = SQL(" CASCADE")
+
+
 class ProcedureKind(generic.AliasEnum):
     """Postgres procedure kinds"""
 
@@ -39,6 +42,11 @@ class ParallelSafety(generic.AliasEnum):
     UNSAFE = "u"
 
 
+# catalog code lookups used by the mapper; the Enum constructor is only called for unknown codes to raise
+_VOLATILITY_BY_CODE: Dict[str, Volatility] = {x.value: x for x in Volatility}
+_PARALLEL_SAFETY_BY_CODE: Dict[str, ParallelSafety] = {x.value: x for x in ParallelSafety}
+
+
 class _BaseProcedure(generic._DynamicObject, generic._CollectionChild):
     """Postgres Procedure base object. Represents a stored procedure,
     function, window function or aggregate on a Postgres server.
@@ -90,8 +98,7 @@ class _BaseProcedure(generic._DynamicObject, generic._CollectionChild):
         volatility: Volatility = Volatility.VOLATILE,
         parallel_mode: ParallelSafety = ParallelSafety.UNSAFE,
     ):
-        super().__init__(kind=kind, cluster=cluster, oid=oid, name=name, schema=schema)
-        generic._CollectionChild.__init__(self, parent=parent)
+        super().__init__(kind=kind, cluster=cluster, oid=oid, name=name, schema=schema, parent=parent)
         self._language = language
         self._owner = owner
         self._security_definer = security_definer
@@ -145,7 +152,7 @@ class _BaseProcedure(generic._DynamicObject, generic._CollectionChild):
 
         sql = SQL(f"DROP {self.kind} {{procedure}}").format(procedure=self._sql_fqn())
         if cascade:
-            sql += SQL(" CASCADE")
+            sql += _SQL_CASCADE
         self.cluster.execute(sql)
 
     def refresh(self):
@@ -325,7 +332,9 @@ class Aggregate(_BaseProcedure):
 class _ProcedureMapper(generic._BaseObjectMapper[_BaseProcedure]):
     """Maps out a resultset from a database query to a procedure object"""
 
-    attributes = [
+    __slots__ = ()
+
+    attributes = (
         "oid",
         "name",
         "schema",
@@ -338,8 +347,8 @@ class _ProcedureMapper(generic._BaseObjectMapper[_BaseProcedure]):
         "volatility",
         "parallel_mode",
         "argument_types",
-    ]
-    exclude = ["kind", "volatility", "parallel_mode"]
+    )
+    exclude = ("kind", "volatility", "parallel_mode")
 
     def map(self, obj: _BaseProcedure) -> _BaseProcedure:
         """Assigns attributes to the Postgres procedure based on
@@ -349,8 +358,10 @@ class _ProcedureMapper(generic._BaseObjectMapper[_BaseProcedure]):
             obj (_ProcedureBase): Postgres procedure object
         """
         super().map(obj)
-        obj._volatility = Volatility(self["volatility"])
-        obj._parallel_mode = ParallelSafety(self["parallel_mode"])
+        volatility = self.get_field(self.definition, "volatility")
+        parallel_mode = self.get_field(self.definition, "parallel_mode")
+        obj._volatility = _VOLATILITY_BY_CODE.get(volatility) or Volatility(volatility)
+        obj._parallel_mode = _PARALLEL_SAFETY_BY_CODE.get(parallel_mode) or ParallelSafety(parallel_mode)
 
         return obj
 
@@ -43,8 +43,7 @@ class ReplicationSlot(generic._DynamicObject, generic._CollectionChild):
         parent: "ReplicationSlotCollection" = None,
     ):
         """Initialize a new ReplicationSlot object"""
-        super().__init__(cluster=cluster, name=name, kind="REPLICATION SLOT")
-        generic._CollectionChild.__init__(self, parent=parent)
+        super().__init__(cluster=cluster, name=name, kind="REPLICATION SLOT", parent=parent)
         self._plugin = plugin
         self._slot_type = "logical"
         self._database = None
@@ -163,7 +162,9 @@ class ReplicationSlot(generic._DynamicObject, generic._CollectionChild):
 class _ReplicationSlotMapper(generic._BaseObjectMapper[ReplicationSlot]):
     """Maps out a resultset from a replication slot query to a replication slot object"""
 
-    attributes = [
+    __slots__ = ()
+
+    attributes = (
         "name",
         "plugin",
         "slot_type",
@@ -175,7 +176,7 @@ class _ReplicationSlotMapper(generic._BaseObjectMapper[ReplicationSlot]):
         "catalog_xmin",
         "restart_lsn",
         "confirmed_flush_lsn",
-    ]
+    )
 
 
 class ReplicationSlotCollection(generic._BaseCollection[ReplicationSlot]):
@@ -192,14 +193,17 @@ class ReplicationSlotCollection(generic._BaseCollection[ReplicationSlot]):
         super().refresh()
         sql = util.get_sql("get_replication_slot") + SQL(" ORDER BY slot_name")
         result = self.cluster.execute(sql)
-        for mapper in [_ReplicationSlotMapper(x) for x in result]:
-            self[mapper["name"]] = mapper.map(
+        get_field, map_row = _ReplicationSlotMapper.get_field, _ReplicationSlotMapper.map_row
+        for row in result:
+            name = get_field(row, "name")
+            self[name] = map_row(
                 ReplicationSlot(
                     cluster=self.cluster,
-                    name=mapper["name"],
-                    plugin=mapper["plugin"],
+                    name=name,
+                    plugin=get_field(row, "plugin"),
                     parent=self,
-                )
+                ),
+                row,
             )
 
     def new(
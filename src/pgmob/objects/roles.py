@@ -1,6 +1,6 @@
 """Postgresql roles"""
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union, cast
 from ..adapters import AdapterError
 from ..sql import SQL, Composable, Literal, Identifier
 from ..errors import *
@@ -64,8 +64,7 @@ class Role(generic._DynamicObject, generic._CollectionChild):
         oid: int = None,
         parent: "RoleCollection" = None,
     ):
-        super().__init__(kind="ROLE", cluster=cluster, oid=oid, name=name)
-        generic._CollectionChild.__init__(self, parent=parent)
+        super().__init__(kind="ROLE", cluster=cluster, oid=oid, name=name, parent=parent)
         self._password = password
         self._cluster = cluster
         self._superuser = superuser
@@ -216,9 +215,10 @@ class Role(generic._DynamicObject, generic._CollectionChild):
 
     def create(self) -> None:
         """Create a role on the Postgres cluster"""
-        self.cluster.execute(self.script(as_composable=True))
-        sql = util.get_sql("get_role") + SQL(" WHERE rolname = %s")
-        _RoleMapper(self.cluster.execute(sql, self.name)[0]).map(self)
+        # create and read back the role in a single round-trip; only the last resultset is returned
+        sql = cast(Composable, self.script(as_composable=True)) + SQL("; ") + util.get_sql("get_role")
+        sql += SQL(" WHERE rolname = {name}").format(name=Literal(self.name))
+        _RoleMapper(self.cluster.execute(sql)[0]).map(self)
 
     def drop(self, force: bool = False) -> None:
         """Drops the role connected to this object
@@ -270,7 +270,9 @@ class Role(generic._DynamicObject, generic._CollectionChild):
 class _RoleMapper(generic._BaseObjectMapper[Role]):
     """Maps out a resultset from a database query to a role object"""
 
-    attributes = [
+    __slots__ = ()
+
+    attributes = (
         "name",
         "superuser",
         "inherit",
@@ -282,7 +284,7 @@ class _RoleMapper(generic._BaseObjectMapper[Role]):
         "valid_until",
         "bypassrls",
         "oid",
-    ]
+    )
 
 
 class RoleCollection(generic._BaseCollection[Role]):
@@ -305,8 +307,10 @@ class RoleCollection(generic._BaseCollection[Role]):
         super().refresh()
         sql = util.get_sql("get_role") + SQL(" ORDER BY rolname")
         result = self.cluster.execute(sql)
-        for mapper in [_RoleMapper(x) for x in result]:
-            self[mapper["name"]] = mapper.map(Role(cluster=self.cluster, name=mapper["name"], parent=self))
+        get_field, map_row = _RoleMapper.get_field, _RoleMapper.map_row
+        for row in result:
+            name = get_field(row, "name")
+            self[name] = map_row(Role(cluster=self.cluster, name=name, parent=self), row)
 
     def new(
         self,
@@ -1,6 +1,6 @@
 """Schema objects. Represents schemas on the Postgres cluster"""
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
-from ..sql import SQL, Composable, Identifier
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union, cast
+from ..sql import SQL, Composable, Identifier, Literal
 from ..errors import *
 from .. import util
 from . import generic
@@ -10,6 +10,10 @@ if TYPE_CHECKING:
     from ..cluster import Cluster
 
 
+_SQL_DROP = SQL("DROP SCHEMA {schema}")
+_SQL_DROP_CASCADE = SQL("DROP SCHEMA {schema} CASCADE")
+
+
 class Schema(generic._DynamicObject, generic._CollectionChild):
     """Postgres schema object. Represents a schema object on a Postgres cluster.
 
@@ -35,8 +39,7 @@ class Schema(generic._DynamicObject, generic._CollectionChild):
         parent: "SchemaCollection" = None,
         oid: Optional[int] = None,
     ):
-        super().__init__(cluster=cluster, name=name, kind="SCHEMA", oid=oid)
-        generic._CollectionChild.__init__(self, parent=parent)
+        super().__init__(cluster=cluster, name=name, kind="SCHEMA", oid=oid, parent=parent)
         self._owner = owner
 
     @property
@@ -62,9 +65,7 @@ class Schema(generic._DynamicObject, generic._CollectionChild):
             cascade (bool): drop dependent objects
         """
 
-        sql = SQL("DROP SCHEMA {schema}").format(schema=self._sql_fqn())
-        if cascade:
-            sql += SQL(" CASCADE")
+        sql = (_SQL_DROP_CASCADE if cascade else _SQL_DROP).format(schema=self._sql_fqn())
         self.cluster.execute(sql)
 
     def refresh(self):
@@ -80,9 +81,10 @@ class Schema(generic._DynamicObject, generic._CollectionChild):
 
     def create(self):
         """Create a database on the Postgres cluster"""
-        self.cluster.execute(self.script(as_composable=True))
-        sql = util.get_sql("get_schema") + SQL(" WHERE n.nspname = %s")
-        _SchemaMapper(self.cluster.execute(sql, self.name)[0]).map(self)
+        # create and read back the schema in a single round-trip; only the last resultset is returned
+        sql = cast(Composable, self.script(as_composable=True)) + SQL("; ") + util.get_sql("get_schema")
+        sql += SQL(" WHERE n.nspname = {name}").format(name=Literal(self.name))
+        _SchemaMapper(self.cluster.execute(sql)[0]).map(self)
 
     def script(self, as_composable: bool = False) -> Union[str, Composable]:
         """Generate a schema creation script.
@@ -110,11 +112,13 @@ class Schema(generic._DynamicObject, generic._CollectionChild):
 class _SchemaMapper(generic._BaseObjectMapper[Schema]):
     """Maps out a resultset from a database query to a schema object"""
 
-    attributes = [
+    __slots__ = ()
+
+    attributes = (
         "name",
         "owner",
         "oid",
-    ]
+    )
 
 
 class SchemaCollection(generic._BaseCollection[Schema]):
@@ -130,8 +134,10 @@ class SchemaCollection(generic._BaseCollection[Schema]):
         super().refresh()
         sql = util.get_sql("get_schema")
         result = self.cluster.execute(sql)
-        for mapper in [_SchemaMapper(x) for x in result]:
-            self[mapper["name"]] = mapper.map(Schema(cluster=self.cluster, name=mapper["name"], parent=self))
+        get_field, map_row = _SchemaMapper.get_field, _SchemaMapper.map_row
+        for row in result:
+            name = get_field(row, "name")
+            self[name] = map_row(Schema(cluster=self.cluster, name=name, parent=self), row)
 
     def new(
         self,
@@ -10,6 +10,10 @@ if TYPE_CHECKING:
     from ..cluster import Cluster
 
 
+_SQL_DROP = SQL("DROP SEQUENCE {seq}")
+_SQL_DROP_CASCADE = SQL("DROP SEQUENCE {seq} CASCADE")
+
+
 class Sequence(generic._DynamicObject, generic._CollectionChild):
     """Postgres sequence object. Represents a sequence on a Postgres server.
 
@@ -47,8 +51,7 @@ class Sequence(generic._DynamicObject, generic._CollectionChild):
         oid: Optional[int] = None,
     ):
         """Initialize a new Sequence object"""
-        super().__init__(kind="SEQUENCE", cluster=cluster, oid=oid, name=name, schema=schema)
-        generic._CollectionChild.__init__(self, parent=parent)
+        super().__init__(kind="SEQUENCE", cluster=cluster, oid=oid, name=name, schema=schema, parent=parent)
         self._owner = owner
         self._schema: str = schema
         self._data_type: Optional[str] = None
@@ -178,9 +181,7 @@ class Sequence(generic._DynamicObject, generic._CollectionChild):
             cascade (bool): drop dependent objects
         """
 
-        sql = SQL("DROP SEQUENCE {seq}").format(seq=self._sql_fqn())
-        if cascade:
-            sql += SQL(" CASCADE")
+        sql = (_SQL_DROP_CASCADE if cascade else _SQL_DROP).format(seq=self._sql_fqn())
         self.cluster.execute(sql)
 
     def nextval(self):
@@ -222,7 +223,9 @@ class Sequence(generic._DynamicObject, generic._CollectionChild):
 class _SequenceMapper(generic._BaseObjectMapper[Sequence]):
     """Maps out a resultset from a database query to a sequence object"""
 
-    attributes = [
+    __slots__ = ()
+
+    attributes = (
         "name",
         "owner",
         "schema",
@@ -235,7 +238,7 @@ class _SequenceMapper(generic._BaseObjectMapper[Sequence]):
         "cache_size",
         "last_value",
         "oid",
-    ]
+    )
 
 
 class SequenceCollection(generic._BaseCollection[Sequence]):
@@ -253,15 +256,18 @@ class SequenceCollection(generic._BaseCollection[Sequence]):
         super().refresh()
         sql = util.get_sql("get_sequence")
         result = self.cluster.execute(sql)
-        for mapper in [_SequenceMapper(x) for x in result]:
-            self[self._index(name=mapper["name"], schema=mapper["schema"])] = mapper.map(
+        get_field, map_row = _SequenceMapper.get_field, _SequenceMapper.map_row
+        for row in result:
+            name, schema = get_field(row, "name"), get_field(row, "schema")
+            self[self._index(name=name, schema=schema)] = map_row(
                 Sequence(
                     cluster=self.cluster,
-                    name=mapper["name"],
-                    schema=mapper["schema"],
+                    name=name,
+                    schema=schema,
                     parent=self,
-                    oid=mapper["oid"],
-                )
+                    oid=get_field(row, "oid"),
+                ),
+                row,
             )
 
     # TODO: uncomment when .create() and .new() are implemented
@@ -1,6 +1,7 @@
 """Postgresql table objects"""
+from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
-from ..sql import SQL, Identifier
+from ..sql import SQL, Composable, Identifier
 from ..errors import *
 from .. import util
 from . import generic
@@ -10,6 +11,19 @@ if TYPE_CHECKING:
     from ..cluster import Cluster
 
 
+_SQL_DROP = SQL("DROP TABLE {table}")
+_SQL_DROP_CASCADE = SQL("DROP TABLE {table} CASCADE")
+_SQL_SET_TABLESPACE = SQL("ALTER TABLE {fqn} SET TABLESPACE {tablespace}")
+_SQL_ENABLE_RLS = SQL("ALTER TABLE {fqn} ENABLE ROW LEVEL SECURITY")
+_SQL_DISABLE_RLS = SQL("ALTER TABLE {fqn} DISABLE ROW LEVEL SECURITY")
+
+
+@lru_cache(maxsize=1)
+def _get_table_by_oid_sql() -> Composable:
+    """Returns the query that retrieves a single table by oid. Built on first use, not on import."""
+    return util.get_sql("get_table") + SQL(" WHERE c.oid = %s")
+
+
 class Table(generic._DynamicObject, generic._CollectionChild):
     """Postgres Table object. Represents a table object on a Postgres server.
 
@@ -31,6 +45,8 @@ class Table(generic._DynamicObject, generic._CollectionChild):
         oid (int): Table OID
     """
 
+    __slots__ = ("_parent", "_owner", "_tablespace", "_row_security")
+
     def __init__(
         self,
         name: str,
@@ -41,8 +57,7 @@ class Table(generic._DynamicObject, generic._CollectionChild):
         oid: Optional[int] = None,
     ):
         """Initialize a new Table object"""
-        super().__init__(kind="TABLE", cluster=cluster, oid=oid, name=name, schema=schema)
-        generic._CollectionChild.__init__(self, parent=parent)
+        super().__init__(kind="TABLE", cluster=cluster, oid=oid, name=name, schema=schema, parent=parent)
         self._schema: str = schema
         self._owner = owner
         self._tablespace: Optional[str] = None
@@ -54,17 +69,14 @@ class Table(generic._DynamicObject, generic._CollectionChild):
         Args:
             cascade (bool): drop dependent objects
         """
-        sql = SQL("DROP TABLE {table}").format(table=self._sql_fqn())
-        if cascade:
-            sql += SQL(" CASCADE")
+        sql = (_SQL_DROP_CASCADE if cascade else _SQL_DROP).format(table=self._sql_fqn())
         self.cluster.execute(sql)
 
     def refresh(self):
         """Re-initializes the object, refreshing its properties from Postgres cluster"""
         super().refresh()
         if not self._ephemeral:
-            sql = util.get_sql("get_table") + SQL(" WHERE c.oid = %s")
-            result = self.cluster.execute(sql, (self.oid,))
+            result = self.cluster.execute(_get_table_by_oid_sql(), (self.oid,))
             if not result:
                 raise PostgresError("Table with oid %s was not found", self.oid)
             mapper = _TableMapper(result[0])
@@ -79,9 +91,7 @@ class Table(generic._DynamicObject, generic._CollectionChild):
         if self._tablespace != value:
             self._changes["tablespace"] = generic._SQLChange(
                 obj=self,
-                sql=SQL("ALTER TABLE {fqn} SET TABLESPACE {tablespace}").format(
-                    fqn=self._sql_fqn(), tablespace=Identifier(value)
-                ),
+                sql=_SQL_SET_TABLESPACE.format(fqn=self._sql_fqn(), tablespace=Identifier(value)),
             )
             self._tablespace = value
 
@@ -92,10 +102,10 @@ class Table(generic._DynamicObject, generic._CollectionChild):
     @row_security.setter
     def row_security(self, value: bool):
         if self._row_security != value:
-            keyword = "ENABLE" if value else "DISABLE"
+            template = _SQL_ENABLE_RLS if value else _SQL_DISABLE_RLS
             self._changes["row_security"] = generic._SQLChange(
                 obj=self,
-                sql=SQL(f"ALTER TABLE {{fqn}} {keyword} ROW LEVEL SECURITY").format(fqn=self._sql_fqn()),
+                sql=template.format(fqn=self._sql_fqn()),
             )
             self._row_security = value
 
@@ -127,14 +137,17 @@ class Table(generic._DynamicObject, generic._CollectionChild):
 class _TableMapper(generic._BaseObjectMapper[Table]):
     """Maps out a resultset from a database query to a table object"""
 
-    attributes = [
+    __slots__ = ()
+
+    attributes = (
         "name",
         "owner",
         "schema",
         "tablespace",
         "row_security",
         "oid",
-    ]
+    )
+    interned = ("owner", "schema", "tablespace")
 
 
 class TableCollection(generic._BaseCollection[Table]):
@@ -151,14 +164,13 @@ class TableCollection(generic._BaseCollection[Table]):
         """Resets any pending changes and refreshes the list of child objects from the cluster"""
         super().refresh()
         sql = util.get_sql("get_table")
-        result = self.cluster.execute(sql)
-        for mapper in [_TableMapper(x) for x in result]:
-            self[self._index(name=mapper["name"], schema=mapper["schema"])] = mapper.map(
-                Table(
-                    cluster=self.cluster,
-                    name=mapper["name"],
-                    schema=mapper["schema"],
-                    parent=self,
-                    oid=mapper["oid"],
-                )
-            )
+        # the catalog-wide scan is streamed from the server rather than fetched at once
+        result = self.cluster._execute_stream(sql, name="pgmob_tables")
+        cluster = self.cluster
+        get_field, map_row = _TableMapper.get_field, _TableMapper.map_row
+        # members are created bound to the collection cluster, no need for the checks in __setitem__
+        setitem = dict.__setitem__
+        for row in result:
+            name, schema = get_field(row, "name"), get_field(row, "schema")
+            table = Table(cluster=cluster, name=name, schema=schema, parent=self, oid=get_field(row, "oid"))
+            setitem(self, name if schema == "public" else f"{schema}.{name}", map_row(table, row))
@@ -10,6 +10,10 @@ if TYPE_CHECKING:
     from ..cluster import Cluster
 
 
+_SQL_DROP = SQL("DROP VIEW {view}")
+_SQL_DROP_CASCADE = SQL("DROP VIEW {view} CASCADE")
+
+
 class View(generic._DynamicObject, generic._CollectionChild):
     """Postgres View object. Represents a view object on a Postgres server.
 
@@ -39,8 +43,7 @@ class View(generic._DynamicObject, generic._CollectionChild):
         oid: Optional[int] = None,
     ):
         """Initialize a new View object"""
-        super().__init__(kind="VIEW", cluster=cluster, oid=oid, name=name, schema=schema)
-        generic._CollectionChild.__init__(self, parent=parent)
+        super().__init__(kind="VIEW", cluster=cluster, oid=oid, name=name, schema=schema, parent=parent)
         self._schema: str = schema
         self._owner = owner
 
@@ -50,9 +53,7 @@ class View(generic._DynamicObject, generic._CollectionChild):
         Args:
             cascade (bool): drop dependent objects
         """
-        sql = SQL("DROP VIEW {view}").format(view=self._sql_fqn())
-        if cascade:
-            sql += SQL(" CASCADE")
+        sql = (_SQL_DROP_CASCADE if cascade else _SQL_DROP).format(view=self._sql_fqn())
         self.cluster.execute(sql)
 
     def refresh(self):
@@ -94,12 +95,14 @@ class View(generic._DynamicObject, generic._CollectionChild):
 class _ViewMapper(generic._BaseObjectMapper[View]):
     """Maps out a resultset from a database query to a table object"""
 
-    attributes = [
+    __slots__ = ()
+
+    attributes = (
         "name",
         "owner",
         "schema",
         "oid",
-    ]
+    )
 
 
 class ViewCollection(generic._BaseCollection[View]):
@@ -117,13 +120,16 @@ class ViewCollection(generic._BaseCollection[View]):
         super().refresh()
         sql = util.get_sql("get_view")
         result = self.cluster.execute(sql)
-        for mapper in [_ViewMapper(x) for x in result]:
-            self[self._index(name=mapper["name"], schema=mapper["schema"])] = mapper.map(
+        get_field, map_row = _ViewMapper.get_field, _ViewMapper.map_row
+        for row in result:
+            name, schema = get_field(row, "name"), get_field(row, "schema")
+            self[self._index(name=name, schema=schema)] = map_row(
                 View(
                     cluster=self.cluster,
-                    name=mapper["name"],
-                    schema=mapper["schema"],
+                    name=name,
+                    schema=schema,
                     parent=self,
-                    oid=mapper["oid"],
-                )
+                    oid=get_field(row, "oid"),
+                ),
+                row,
             )
@@ -4,7 +4,7 @@ classes are eventually decoded by adapters into SQL statements with appropriate
 
 import string
 
-from typing import Generator, List, Sequence, Union
+from typing import Generator, List, Optional, Sequence, Tuple, Union
 
 
 class Composable:
@@ -109,6 +109,7 @@ class SQL(_Singleton):
 
     def __init__(self, statement: str) -> None:
         super().__init__(statement)
+        self._template: Optional[List[Tuple[str, Optional[str]]]] = None
 
     def join(self, iter: Sequence[Composable]) -> Composed:
         """Joins basic query building blocks, such as SQL, Literal, Identifier.
@@ -148,9 +149,14 @@ class SQL(_Singleton):
             )
         """
         formatter = string.Formatter()
+        if self._template is None:
+            # parse the statement once, so that reused SQL objects only bind values on format
+            self._template = [
+                (text, field_name) for text, field_name, _, _ in formatter.parse(str(self._value))
+            ]
         parts = []
         field_counter = -1
-        for text, field_name, format_spec, conversion in formatter.parse(str(self._value)):
+        for text, field_name in self._template:
             parts.append(SQL(text))
             if field_name is not None:
                 if field_name:
@@ -1,11 +1,10 @@
 """Internal module utilities."""
-from typing import Callable, Dict, List, Sequence, Type, TypeVar
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Type, TypeVar
 from pgmob.sql import SQL
 from pathlib import Path
+import os
 import re
-from functools import reduce
-from collections import defaultdict
-from packaging.version import Version as _Version
+from functools import lru_cache, total_ordering
 
 
 _T = TypeVar("_T")
@@ -21,28 +20,81 @@ def group_by(key: Callable[..., str], seq: Sequence[_T]) -> Dict[str, List[_T]]:
     Returns:
         dict: a dictionary grouped by keys
     """
-    return reduce(lambda grp, val: grp[key(val)].append(val) or grp, seq, defaultdict(list))  # type: ignore
+    result: Dict[str, List[_T]] = {}
+    setdefault = result.setdefault
+    for val in seq:
+        setdefault(key(val), []).append(val)
+    return result
 
 
-class Version(_Version):
-    """Version object. Allows to track major, minor, build and revision versions, left to right."""
+@total_ordering
+class Version(object):
+    """Version object. Allows to track major, minor, build and revision versions, left to right.
+    Only dot-separated numbers are supported; trailing zeros are ignored on comparison.
 
-    @property
-    def build(self):
-        return self.micro
+    Args:
+        version (str): version string, e.g. "14.5"
+    """
 
-    @property
-    def revision(self):
-        return 0 if len(self.release) < 4 else self.release[3]
+    __slots__ = ("release", "_key")
 
-    def __new__(cls, version):
+    def __init__(self, version: str):
         try:
-            parts = [int(x) for x in version.split(".")]
-        except:
+            parts = version.split(".")
+        except AttributeError:
             raise ValueError("Unsupported version string. Only dot-separated numbers are supported.")
-        if len(parts) == 0:
-            raise ValueError("Empty version string")
-        return _Version.__new__(cls)
+        if not all(x.isdigit() for x in parts):
+            raise ValueError("Unsupported version string. Only dot-separated numbers are supported.")
+        self.release: Tuple[int, ...] = tuple(int(x) for x in parts)
+        key = list(self.release)
+        while len(key) > 1 and key[-1] == 0:
+            key.pop()
+        self._key = tuple(key)
+
+    def _part(self, index: int) -> int:
+        return self.release[index] if len(self.release) > index else 0
+
+    @property
+    def major(self) -> int:
+        return self.release[0]
+
+    @property
+    def minor(self) -> int:
+        return self._part(1)
+
+    @property
+    def micro(self) -> int:
+        return self._part(2)
+
+    @property
+    def build(self) -> int:
+        return self._part(2)
+
+    @property
+    def revision(self) -> int:
+        return self._part(3)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key == other._key
+
+    def __lt__(self, other: "Version") -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self._key < other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __str__(self) -> str:
+        return ".".join(str(x) for x in self.release)
+
+    def __repr__(self) -> str:
+        return f"<Version('{self}')>"
+
+
+_SQL_FILE_RE = re.compile(r"^(?P<name>.+)_(?P<ver>\d+)\.sql$")
 
 
 def get_sql(name: str, version: Version = None) -> SQL:
@@ -55,21 +107,24 @@ def get_sql(name: str, version: Version = None) -> SQL:
     Returns:
         SQL: sql code
     """
+    return _load_sql(name, version.major if version else None)
+
+
+@lru_cache(maxsize=None)
+def _load_sql(name: str, major: Optional[int]) -> SQL:
+    """Reads SQL code from disk. Results are cached, as the scripts do not change at runtime."""
     root_path = Path(__file__).parent / "scripts" / "sql"
-    if version:
-        filename = f"{name}.sql"
-        matcher = re.compile(re.escape(name) + "_(\\d+)\\.sql")
-        files = list(root_path.glob(f"{name}_*.sql"))
-        files.sort()
-        for file in files:
-            match = matcher.match(file.name)
-            if match and version.major >= int(match[1]):
-                filename = file.name
-    else:
-        filename = f"{name}.sql"
-    path = root_path / filename
-    with path.open() as sql_file:
-        return SQL(sql_file.read())
+    filename = f"{name}.sql"
+    if major is not None:
+        # pick the script for the highest version that does not exceed the requested one
+        best = -1
+        with os.scandir(root_path) as entries:
+            for entry in entries:
+                match = _SQL_FILE_RE.match(entry.name)
+                if match and match["name"] == name and best < int(match["ver"]) <= major:
+                    best = int(match["ver"])
+                    filename = entry.name
+    return SQL((root_path / filename).read_text(encoding="utf-8"))
 
 
 def get_shell(name: str) -> str:
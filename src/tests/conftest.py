@@ -1,5 +1,6 @@
 from collections import namedtuple
-from typing import List
+from operator import attrgetter
+from typing import Iterator
 import pytest
 from unittest.mock import Mock
 from pytest_mock import MockerFixture
@@ -8,29 +9,161 @@ from pgmob.adapters.base import BaseAdapter
 from pgmob.cluster import Cluster
 
 
+ReplicationSlotTuple = namedtuple(
+    "ReplicationSlotTuple",
+    [
+        "slot_name",
+        "plugin",
+        "slot_type",
+        "database",
+        "temporary",
+        "active",
+        "active_pid",
+        "xmin",
+        "catalog_xmin",
+        "restart_lsn",
+        "confirmed_flush_lsn",
+    ],
+)
+
+RoleTuple = namedtuple(
+    "RoleTuple",
+    [
+        "rolname",
+        "rolsuper",
+        "rolinherit",
+        "rolcreaterole",
+        "rolcreatedb",
+        "rolcanlogin",
+        "rolreplication",
+        "rolconnlimit",
+        "rolvaliduntil",
+        "rolbypassrls",
+        "oid",
+    ],
+)
+
+SchemaTuple = namedtuple(
+    typename="SchemaTuple",
+    field_names=[
+        "nspname",
+        "nspowner",
+        "oid",
+    ],
+)
+
+ViewTuple = namedtuple(
+    typename="ViewTuple",
+    field_names=[
+        "viewname",
+        "viewowner",
+        "schemaname",
+        "oid",
+    ],
+)
+
+TableTuple = namedtuple(
+    typename="TableTuple",
+    field_names=[
+        "tablename",
+        "tableowner",
+        "schemaname",
+        "tablespace",
+        "rowsecurity",
+        "oid",
+    ],
+)
+
+SequenceTuple = namedtuple(
+    typename="SequenceTuple",
+    field_names=[
+        "sequencename",
+        "sequenceowner",
+        "schemaname",
+        "data_type",
+        "start_value",
+        "min_value",
+        "max_value",
+        "increment_by",
+        "cycle",
+        "cache_size",
+        "last_value",
+        "oid",
+    ],
+)
+
+DatabaseTuple = namedtuple(
+    typename="DatabaseTuple",
+    field_names=[
+        "datname",
+        "datowner",
+        "encoding",
+        "datcollate",
+        "datctype",
+        "datistemplate",
+        "datallowconn",
+        "datconnlimit",
+        "datlastsysoid",
+        "datfrozenxid",
+        "datminmxid",
+        "tablespace",
+        "datacl",
+        "oid",
+    ],
+)
+
+LargeObjectTuple = namedtuple(
+    typename="LargeObjectTuple",
+    field_names=[
+        "oid",
+        "lomowner",
+    ],
+)
+
+ProcedureTuple = namedtuple(
+    typename="ProcedureTuple",
+    field_names=[
+        "oid",
+        "proname",
+        "schemaname",
+        "proowner",
+        "prolang",
+        "prokind",
+        "prosecdef",
+        "proleakproof",
+        "proisstrict",
+        "provolatile",
+        "proparallel",
+        "proargtypes",
+    ],
+)
+
+
+_get_value = attrgetter("_value")
+
+
 class PGMobTester:
     @staticmethod
-    def _parse_calls(*args, statement: int = None) -> List[str]:
-        singletons: List[str] = []
+    def _parse_calls(*args, statement: int = None) -> Iterator[str]:
         statements = [args[statement]] if statement else args
-        for singleton in [x.args[0] for x in statements]:
+        for call in statements:
+            singleton = call.args[0]
             if isinstance(singleton, Composed):
-                singletons.extend([str(x._value) for x in singleton._parts])
+                yield from map(str, map(_get_value, singleton._parts))
             else:
-                singletons.append(singleton._value)
-        return singletons
+                yield singleton._value
 
     @staticmethod
     def assertSql(sql: str, cursor: Mock, statement: int = None, mogrify: bool = False):
-        singletons = PGMobTester._parse_calls(
-            *(cursor.mogrify.call_args_list if mogrify else cursor.execute.call_args_list)
-        )
+        calls = cursor.mogrify.call_args_list if mogrify else cursor.execute.call_args_list
         assert any(
-            [sql in x for x in singletons]
-        ), "{sql} was supposed to be among statements:\n{stmts}".format(sql=sql, stmts="\n".join(singletons))
+            sql in x for x in PGMobTester._parse_calls(*calls)
+        ), "{sql} was supposed to be among statements:\n{stmts}".format(
+            sql=sql, stmts="\n".join(PGMobTester._parse_calls(*calls))
+        )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def pgmob_tester():
     return PGMobTester()
 
@@ -38,15 +171,17 @@ def pgmob_tester():
 @pytest.fixture
 def cursor(mocker):
     """Cursor object"""
-    cursor = mocker.MagicMock()
-    return cursor
+    from psycopg2.extensions import cursor as _cursor
+
+    return mocker.MagicMock(spec=_cursor)
 
 
 @pytest.fixture
 def lobject(mocker):
     """Large Object handler"""
-    lobject = mocker.MagicMock()
-    return lobject
+    from psycopg2.extensions import lobject as _lobject
+
+    return mocker.Mock(spec=_lobject)
 
 
 @pytest.fixture
@@ -67,31 +202,45 @@ def cursor_fetch_version(cursor, db_name: str):
 @pytest.fixture
 def psycopg2_connection(mocker: MockerFixture, cursor, lobject):
     """psycopg2 connection emulator"""
-    pg_conn = mocker.MagicMock()
+    from psycopg2.extensions import connection
+
+    pg_conn = mocker.Mock(spec=connection)
     pg_conn.cursor.return_value = cursor
     pg_conn.lobject.return_value = lobject
     pg_conn.closed = False
     return pg_conn
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def db_name():
     """Test database name"""
     return "pgmobdb"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def old_db_name(db_name):
     """Test database name"""
     return db_name
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def new_db_name():
     """Test database name"""
     return "pgmobdbnew"
 
 
+def _passthrough_query(self, query):
+    return query
+
+
+@pytest.fixture
+def passthrough_query(monkeypatch: pytest.MonkeyPatch):
+    """Makes the psycopg2 cursor hand queries over to the mocked cursor without conversion"""
+    from pgmob.adapters.psycopg2 import Psycopg2Cursor
+
+    monkeypatch.setattr(Psycopg2Cursor, "_convert_query", _passthrough_query)
+
+
 @pytest.fixture
 def cluster(
     psycopg2_connection,
@@ -99,34 +248,18 @@ def cluster(
     mocker: MockerFixture,
     cursor,
     cursor_fetch_version,
+    passthrough_query,
 ):
     """Returns a cluster object with mocked connection and run_os_command"""
-    mocker.patch("pgmob.adapters.psycopg2.Psycopg2Cursor._convert_query", lambda _, x: x)
     cluster = Cluster(connection=psycopg2_connection)
     cursor.fetchall.return_value = None
     monkeypatch.setattr(cluster, "run_os_command", mocker.Mock())
     return cluster
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def slot_tuples():
     """A list of Replication slot tuples"""
-    ReplicationSlotTuple = namedtuple(
-        "ReplicationSlotTuple",
-        [
-            "slot_name",
-            "plugin",
-            "slot_type",
-            "database",
-            "temporary",
-            "active",
-            "active_pid",
-            "xmin",
-            "catalog_xmin",
-            "restart_lsn",
-            "confirmed_flush_lsn",
-        ],
-    )
     return [
         ReplicationSlotTuple(
             slot_name="slot1",
@@ -153,25 +286,9 @@ def cursor_fetch_replication_slots(cursor, slot_tuples):
     return slot_tuples
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def role_tuples():
     """Returns a list of Role Tuples"""
-    RoleTuple = namedtuple(
-        "RoleTuple",
-        [
-            "rolname",
-            "rolsuper",
-            "rolinherit",
-            "rolcreaterole",
-            "rolcreatedb",
-            "rolcanlogin",
-            "rolreplication",
-            "rolconnlimit",
-            "rolvaliduntil",
-            "rolbypassrls",
-            "oid",
-        ],
-    )
     return [
         RoleTuple(
             rolname="pgmob1",
@@ -211,36 +328,18 @@ def cursor_fetch_roles(cursor, role_tuples):
     return role_tuples
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schema_tuples(role_tuples):
     """Returns a list of Schema tuples"""
-    SchemaTuple = namedtuple(
-        typename="SchemaTuple",
-        field_names=[
-            "nspname",
-            "nspowner",
-            "oid",
-        ],
-    )
     return [
         SchemaTuple("pgmob1", role_tuples[0].rolname, 76461),
         SchemaTuple("pgmob2", role_tuples[1].rolname, 76462),
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def view_tuples(role_tuples, schema_tuples):
     """Returns a list of View tuples"""
-
-    ViewTuple = namedtuple(
-        typename="ViewTuple",
-        field_names=[
-            "viewname",
-            "viewowner",
-            "schemaname",
-            "oid",
-        ],
-    )
     return [
         ViewTuple(
             viewname="view1",
@@ -263,20 +362,9 @@ def view_tuples(role_tuples, schema_tuples):
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def table_tuples(role_tuples, schema_tuples):
     """Returns a list of Table tuples"""
-    TableTuple = namedtuple(
-        typename="TableTuple",
-        field_names=[
-            "tablename",
-            "tableowner",
-            "schemaname",
-            "tablespace",
-            "rowsecurity",
-            "oid",
-        ],
-    )
     return [
         TableTuple(
             tablename="tab1",
@@ -305,26 +393,9 @@ def table_tuples(role_tuples, schema_tuples):
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sequence_tuples(role_tuples, schema_tuples):
     """Returns a list of Sequence tuples"""
-    SequenceTuple = namedtuple(
-        typename="SequenceTuple",
-        field_names=[
-            "sequencename",
-            "sequenceowner",
-            "schemaname",
-            "data_type",
-            "start_value",
-            "min_value",
-            "max_value",
-            "increment_by",
-            "cycle",
-            "cache_size",
-            "last_value",
-            "oid",
-        ],
-    )
     return [
         SequenceTuple(
             sequencename="seq1",
@@ -371,28 +442,9 @@ def sequence_tuples(role_tuples, schema_tuples):
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def db_tuples(role_tuples, old_db_name, new_db_name):
     """Returns a list of Database tuples"""
-    DatabaseTuple = namedtuple(
-        typename="DatabaseTuple",
-        field_names=[
-            "datname",
-            "datowner",
-            "encoding",
-            "datcollate",
-            "datctype",
-            "datistemplate",
-            "datallowconn",
-            "datconnlimit",
-            "datlastsysoid",
-            "datfrozenxid",
-            "datminmxid",
-            "tablespace",
-            "datacl",
-            "oid",
-        ],
-    )
     return [
         DatabaseTuple(
             datname=old_db_name,
@@ -429,7 +481,7 @@ def db_tuples(role_tuples, old_db_name, new_db_name):
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def hba_tuples():
     """Returns a list of HBA Rules tuples"""
     return [
@@ -442,16 +494,9 @@ def hba_tuples():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_object_tuples(role_tuples):
     """Returns a list of Large Object tuples"""
-    LargeObjectTuple = namedtuple(
-        typename="LargeObjectTuple",
-        field_names=[
-            "oid",
-            "lomowner",
-        ],
-    )
     return [
         LargeObjectTuple(oid=102, lomowner=role_tuples[0].rolname),
         LargeObjectTuple(oid=2344, lomowner="postgres"),
@@ -459,26 +504,9 @@ def large_object_tuples(role_tuples):
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def procedure_tuples(role_tuples, schema_tuples):
     """Returns a list of Procedure tuples"""
-    ProcedureTuple = namedtuple(
-        typename="ProcedureTuple",
-        field_names=[
-            "oid",
-            "proname",
-            "schemaname",
-            "proowner",
-            "prolang",
-            "prokind",
-            "prosecdef",
-            "proleakproof",
-            "proisstrict",
-            "provolatile",
-            "proparallel",
-            "proargtypes",
-        ],
-    )
     return [
         ProcedureTuple(
             proname="function1",
@@ -563,6 +591,7 @@ def cursor_fetch_tables(cursor, table_tuples):
     Returns a list of tuples describing tables.
     """
     cursor.fetchall.return_value = table_tuples
+    cursor.fetchmany.return_value = table_tuples
     return table_tuples
 
 
@@ -1,25 +1,48 @@
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 from types import ModuleType
 from dataclasses import dataclass
 import pytest
-import docker
 import os
 import time
-from docker.types import ContainerSpec
 from pgmob.cluster import Cluster
 
 
+if TYPE_CHECKING:
+    # the docker SDK is imported on first use to keep it out of test collection
+    import docker
+    from docker.models.containers import Container
+
+
+_DOCKER_AVAILABLE: Optional[bool] = None
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "min_pg_version(major): skip the test when the Postgres server is older than this version"
+    )
+
+
 def pytest_runtest_setup(item):
     """Skip tests if instance details are not defined"""
-    try:
-        docker.from_env()
-    except docker.errors.DockerException:
+    global _DOCKER_AVAILABLE
+    if _DOCKER_AVAILABLE is None:
+        # probe the docker daemon once per session
+        import docker
+
+        try:
+            docker.from_env().close()
+            _DOCKER_AVAILABLE = True
+        except docker.errors.DockerException:
+            _DOCKER_AVAILABLE = False
+    if not _DOCKER_AVAILABLE:
         pytest.skip("Functional tests disabled, docker service not found")
 
 
 @pytest.fixture(scope="session")
-def docker_client() -> docker.DockerClient:
+def docker_client() -> "docker.DockerClient":
     """Returns an initialized docker client"""
+    import docker
+
     return docker.from_env()
 
 
@@ -42,22 +65,34 @@ def pg_password() -> str:
 
 
 @pytest.fixture(scope="session")
-def container(docker_client: docker.DockerClient, container_name, pg_password):
-    pg_image = os.environ.get("PGMOB_IMAGE", "postgres:12")
+def pg_image(docker_client: "docker.DockerClient") -> str:
+    """Returns postgres image tag, pulling the image if it is not available locally"""
+    from docker.errors import ImageNotFound
+
+    image = os.environ.get("PGMOB_IMAGE", "postgres:12")
+    try:
+        docker_client.images.get(image)
+    except ImageNotFound:
+        docker_client.images.pull(image)
+    return image
+
+
+@pytest.fixture(scope="session")
+def container(docker_client: "docker.DockerClient", pg_image, container_name, pg_password):
+    from docker.errors import NotFound
+
     container_network = os.environ.get("PGMOB_CONTAINER_NETWORK", "bridge")
     image_env = {
         "POSTGRES_PASSWORD": pg_password,
     }
     ports = {"5432/tcp": 5432}
     command = "postgres -c 'wal_level=logical'"
-    if not docker_client.images.list(pg_image):
-        docker_client.images.pull(pg_image)
     try:
         container = docker_client.containers.get(container_name)
         if container.status == "running":
             container.stop()
         container.remove()
-    except docker.errors.NotFound:
+    except NotFound:
         pass
     container = docker_client.containers.create(
         image=pg_image,
@@ -68,14 +103,15 @@ def container(docker_client: docker.DockerClient, container_name, pg_password):
         network=container_network,
     )
     container.start()
-    # wait until pg is ready
-    attempts = 0
-    while attempts < 30:
+    # wait until pg is ready, polling with a capped exponential backoff
+    delay = 0.05
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
         if container.exec_run("pg_isready").exit_code == 0:
             if container.exec_run('psql -U postgres -c "select 1"').exit_code == 0:
                 break
-        attempts += 1
-        time.sleep(1)
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.5)
 
     yield container
     # teardown
@@ -86,46 +122,61 @@ def container(docker_client: docker.DockerClient, container_name, pg_password):
     docker_client.close()
 
 
+@pytest.fixture(autouse=True)
+def _min_pg_version(request):
+    """Skips tests marked with min_pg_version before their other fixtures are set up"""
+    marker = request.node.get_closest_marker("min_pg_version")
+    if marker and request.getfixturevalue("shared_cluster").version.major < marker.args[0]:
+        pytest.skip(f"Requires Postgres {marker.args[0]} or newer")
+
+
 @pytest.fixture
-def test_db(psql, container):
-    """Creates a temporary DB in a container
+def test_db(psql, container, test_role):
+    """Creates a temporary DB in a container. Depends on test_role, so that temporary roles are dropped
+    only after the databases with the objects they own
 
     Args:
         name (str): database name
     """
 
     class TestDb:
-        dbs = set()
+        def __init__(self):
+            self.dbs = set()
 
-        @staticmethod
-        def create(name):
-            TestDb.dbs.add(name)
+        def create(self, name):
+            self.dbs.add(name)
             assert psql(f"CREATE DATABASE {name} TEMPLATE template0").exit_code == 0
             return name
 
-        @staticmethod
-        def create_with_table(name):
-            TestDb.create(name)
-            assert psql(cmd="CREATE TABLE test(a int)", db=name).exit_code == 0
+        def create_with_table(self, name):
+            self.dbs.add(name)
+            cmd = (
+                f"CREATE DATABASE {name} TEMPLATE template0;\n\\c {name}\n"
+                "CREATE TABLE test(a int);\n"
+                "INSERT INTO test SELECT generate_series(1, 10000);"
+            )
+            assert psql(cmd).exit_code == 0
             return name
 
-    yield TestDb
+    test_db = TestDb()
+    yield test_db
 
-    for db in TestDb.dbs:
-        assert (
-            psql(f"select pg_terminate_backend(pid) from pg_stat_activity where datname = '{db}'").exit_code
-            == 0
-        )
-        assert container.exec_run(f"dropdb -U postgres --if-exists {db}").exit_code == 0
+    if test_db.dbs:
+        # disconnect all sessions and drop every database in a single psql call
+        names = ", ".join(f"'{db}'" for db in test_db.dbs)
+        cmd = f"SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname IN ({names});"
+        cmd += "".join(f"\nDROP DATABASE IF EXISTS {db};" for db in test_db.dbs)
+        assert psql(cmd).exit_code == 0
 
 
 @pytest.fixture
-def psql(container: ContainerSpec):
+def psql(container: "Container"):
     """Callable that runs a command locally in postgresql container using psql binary.
 
     Args:
         cmd (str): sql command
         db (str): database name. "postgres" by default
+        on_error_stop (bool): stop at the first failed statement. True by default
     """
 
     @dataclass
@@ -133,9 +184,10 @@ def psql(container: ContainerSpec):
         output: str
         exit_code: int
 
-    def wrapper(cmd, db="postgres"):
+    def wrapper(cmd, db="postgres", on_error_stop=True):
+        error_stop = ' -v "ON_ERROR_STOP=1"' if on_error_stop else ""
         result = container.exec_run(
-            ["sh", "-c", f'psql -twA -v "ON_ERROR_STOP=1" -U postgres -d "{db}" << EOM\n{cmd}\nEOM\n']
+            ["sh", "-c", f'psql -twA{error_stop} -U postgres -d "{db}" << EOM\n{cmd}\nEOM\n']
         )
         return ExecRunOutput(output=result.output.decode("utf8").strip(), exit_code=result.exit_code)
 
@@ -175,18 +227,21 @@ def test_role(psql, container):
     """
 
     class TestRole:
-        roles = set()
+        def __init__(self):
+            self.roles = set()
 
-        @staticmethod
-        def create(name, params=""):
-            TestRole.roles.add(name)
+        def create(self, name, params=""):
+            self.roles.add(name)
             assert psql(f"CREATE USER {name} {params}").exit_code == 0
             return name
 
-    yield TestRole
+    test_role = TestRole()
+    yield test_role
 
-    for role in TestRole.roles:
-        assert container.exec_run(f"dropuser -U postgres --if-exists {role}").exit_code == 0
+    if test_role.roles:
+        # one statement per role, so that a role that still owns objects does not keep the others around
+        result = psql("\n".join(f"DROP ROLE IF EXISTS {r};" for r in test_role.roles), on_error_stop=False)
+        assert "ERROR" not in result.output, result.output
 
 
 @pytest.fixture
@@ -213,7 +268,7 @@ def tablespace(psql, container):
     assert psql(f"DROP TABLESPACE {tablespace}").exit_code == 0
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def connect(container, container_name, pg_password):
     """Cluster object factory.
 
@@ -221,9 +276,9 @@ def connect(container, container_name, pg_password):
         dbname (str): database name. "postgres" by default
     """
 
-    def wrapper(db=None, adapter=None):
-        from pgmob.adapters import psycopg2 as _psycopg2
+    from pgmob.adapters import psycopg2 as _psycopg2
 
+    def wrapper(db=None, adapter=None):
         if not adapter:
             adapter = _psycopg2.Psycopg2Adapter(cursor_factory=None)
         return Cluster(
@@ -238,10 +293,22 @@ def connect(container, container_name, pg_password):
     return wrapper
 
 
+@pytest.fixture(scope="session")
+def shared_cluster(connect):
+    """Creates a Cluster object connected to the postgres database, shared by the whole session"""
+    cluster = connect()
+    yield cluster
+    cluster.adapter.close_connection()
+
+
 @pytest.fixture
-def cluster(connect):
-    """Creates a Cluster object connected to the postgres database"""
-    yield connect()
+def cluster(shared_cluster: Cluster):
+    """Shared Cluster object connected to the postgres database, with its cached collections
+    reset before each test"""
+    shared_cluster.refresh()
+    yield shared_cluster
+    if shared_cluster.adapter.is_in_transaction:
+        shared_cluster.adapter.rollback()
 
 
 @pytest.fixture
@@ -250,6 +317,39 @@ def cluster_db(connect, db):
     yield connect(db=db)
 
 
+@pytest.fixture
+def sql_scalar():
+    """Callable that runs a query through an open Cluster connection and returns the first value
+    of the first row, or None when no rows were returned.
+
+    Args:
+        cluster (Cluster): connected Cluster object
+        query (str): sql query
+        params (tuple): query parameters
+    """
+
+    def wrapper(cluster: Cluster, query: str, params: Optional[tuple] = None):
+        result = cluster.execute(query, params)
+        return result[0][0] if result else None
+
+    return wrapper
+
+
+@pytest.fixture
+def sql_batch():
+    """Callable that runs a list of statements through an open Cluster connection in a single round trip.
+
+    Args:
+        cluster (Cluster): connected Cluster object
+        statements (Iterable[str]): sql statements
+    """
+
+    def wrapper(cluster: Cluster, statements: Iterable[str]):
+        cluster.execute("; ".join(statements))
+
+    return wrapper
+
+
 @pytest.fixture
 def plugin():
     """Replication slot plugin name"""
@@ -266,17 +366,16 @@ def replication_slot(psql, plugin, db):
 
 
 @pytest.fixture
-def lo_ids_factory(psql, container):
+def lo_ids_factory(psql):
     """Creates a set of large objects factory"""
 
     def wrapper(db="postgres"):
-        container.exec_run(["sh", "-c", "echo foobar > /tmp/foo.lo"])
-        container.exec_run(["sh", "-c", "echo zoobar > /tmp/zoo.lo"])
-        los = []
-        for file in ["foo", "zoo"]:
-            los.append(int(psql(f"\\lo_import /tmp/{file}.lo", db=db).output.split(" ")[1]))
-
-        return los
+        output = psql(
+            "SELECT lo_from_bytea(0, convert_to(data || chr(10), 'UTF8'))"
+            " FROM unnest(ARRAY['foobar', 'zoobar']) WITH ORDINALITY AS t(data, n) ORDER BY n",
+            db=db,
+        ).output
+        return list(map(int, output.splitlines()))
 
     return wrapper
 
@@ -1,3 +1,4 @@
+import os
 from typing import Sequence
 import pytest
 from pgmob.sql import SQL, Identifier, Literal
@@ -6,6 +7,28 @@ from pgmob.adapters.base import BaseAdapter, BaseCursor, BaseLargeObject
 
 ADAPTERS = ["psycopg2"]
 
+# queries shared by the cursor tests
+_CREATE_A = SQL("CREATE TABLE a(b int); INSERT INTO a VALUES (1)")
+_SELECT_A = SQL("SELECT * from {table}").format(table=Identifier("a"))
+_SELECT_LITERAL = SQL("SELECT {val}").format(val=Literal(1))
+
+
+def _connect(adapter_type: str, host: str, password: str, dbname: str) -> BaseAdapter:
+    if adapter_type == "psycopg2":
+        from pgmob.adapters import psycopg2 as _psycopg2
+
+        adapter = _psycopg2.Psycopg2Adapter()
+        adapter.connect(
+            host=host,
+            port=5432,
+            user="postgres",
+            password=password,
+            dbname=dbname,
+        )
+        return adapter
+    else:
+        raise ValueError("Unknown type %s", adapter_type)
+
 
 @pytest.fixture()
 def adapter_factory(container, container_name, pg_password, db):
@@ -16,20 +39,7 @@ def adapter_factory(container, container_name, pg_password, db):
     """
 
     def wrapper(adapter_type: str):
-        if adapter_type == "psycopg2":
-            from pgmob.adapters import psycopg2 as _psycopg2
-
-            adapter = _psycopg2.Psycopg2Adapter()
-            adapter.connect(
-                host=container_name,
-                port=5432,
-                user="postgres",
-                password=pg_password,
-                dbname=db,
-            )
-            return adapter
-        else:
-            raise ValueError("Unknown type %s", adapter_type)
+        return _connect(adapter_type, host=container_name, password=pg_password, dbname=db)
 
     return wrapper
 
@@ -42,11 +52,22 @@ def adapter(adapter_factory, request):
     return adapter_factory(request.param)
 
 
+@pytest.fixture(scope="module", params=ADAPTERS)
+def shared_adapter(container, container_name, pg_password, request):
+    """Parameterized adapter connected to the postgres database, shared by the cursor tests
+    in this module. Changes are rolled back after each test by the cursor fixture.
+    """
+    adapter = _connect(request.param, host=container_name, password=pg_password, dbname="postgres")
+    yield adapter
+    adapter.close_connection()
+
+
 @pytest.fixture()
-def cursor(adapter):
+def cursor(shared_adapter):
     """Cursor object"""
-    with adapter.cursor() as cur:
+    with shared_adapter.cursor() as cur:
         yield cur
+    shared_adapter.rollback()
 
 
 @pytest.fixture()
@@ -82,25 +103,36 @@ class TestCursor:
 
     def test_scalar(self, cursor: BaseCursor):
         assert cursor.scalar(SQL("SELECT 1")) == 1
-        assert cursor.scalar(SQL("SELECT {val}").format(val=Literal(1))) == 1
-        cursor.execute("CREATE TABLE a(b int); INSERT INTO a VALUES (1)")
-        assert cursor.scalar(SQL("SELECT * from {table}").format(table=Identifier("a"))) == 1
+        assert cursor.scalar(_SELECT_LITERAL) == 1
+        cursor.execute(_CREATE_A)
+        assert cursor.scalar(_SELECT_A) == 1
 
     def test_execute(self, cursor: BaseCursor):
         cursor.execute(SQL("SELECT 1"))
         assert cursor.fetchone()[0] == 1
-        cursor.execute(SQL("SELECT {val}").format(val=Literal(1)))
+        cursor.execute(_SELECT_LITERAL)
         assert cursor.fetchone()[0] == 1
-        cursor.execute("CREATE TABLE a(b int); INSERT INTO a VALUES (1)")
-        cursor.execute(SQL("SELECT * from {table}").format(table=Identifier("a")))
+        cursor.execute(_CREATE_A)
+        cursor.execute(_SELECT_A)
         assert cursor.fetchone()[0] == 1
 
     def test_executemany(self, cursor: BaseCursor):
         cursor.execute("CREATE TABLE a(b int)")
         cursor.executemany(SQL("INSERT INTO a VALUES (%s)"), [(1,), (2,)])
+        assert cursor.rowcount == 2
         cursor.execute(SQL("SELECT * FROM a ORDER BY 1"))
         assert cursor.fetchone()[0] == 1
         assert cursor.fetchone()[0] == 2
+        with pytest.raises(TypeError):
+            cursor.executemany(SQL("INSERT INTO a VALUES (%s)"))
+
+    def test_executemany_paged(self, cursor):
+        cursor.execute("CREATE TABLE a(b int)")
+        # spans multiple pages
+        cursor.executemany(SQL("INSERT INTO a VALUES (%s)"), [(x,) for x in range(1, 5001)], page_size=100)
+        assert cursor.scalar(SQL("SELECT count(*) FROM a")) == 5000
+        with pytest.raises(TypeError):
+            cursor.executemany(SQL("INSERT INTO a VALUES (%s)"), page_size=100)
 
     def test_mogrify(self, cursor: BaseCursor):
         assert (
@@ -119,23 +151,40 @@ class TestCursor:
         assert cursor.fetchone()[0] == 1
         assert cursor.fetchone()[0] == 2
 
+    def test_fetchmany(self, cursor: BaseCursor):
+        cursor.execute(SQL("SELECT generate_series(1, 3)"))
+        assert [x[0] for x in cursor.fetchmany(2)] == [1, 2]
+        assert [x[0] for x in cursor.fetchmany(2)] == [3]
+        assert cursor.fetchmany(2) == []
+
+    def test_named_cursor(self, adapter: BaseAdapter):
+        adapter.set_autocommit(False)
+        with adapter.named_cursor("pgmob_test") as cur:
+            cur.execute(SQL("SELECT generate_series(1, 3)"))
+            assert [x[0] for x in cur.fetchmany(5)] == [1, 2, 3]
+        adapter.rollback()
+
 
 class TestLargeObject:
     @staticmethod
-    def get_current(psql, db, lo_id):
-        return psql(f"SELECT encode(data, 'escape') FROM pg_largeobject WHERE loid = {lo_id}", db=db).output
+    def get_current(cluster_db, sql_scalar, lo_id) -> bytes:
+        """Returns the first page of a large object, as seen by a separate connection"""
+        data = sql_scalar(
+            cluster_db, "SELECT data FROM pg_largeobject WHERE loid = %s AND pageno = 0", (lo_id,)
+        )
+        return bytes(data) if data is not None else b""
 
     def test_close(self, lobject_r: BaseLargeObject):
         assert lobject_r.closed == False
         lobject_r.close()
         assert lobject_r.closed == True
 
-    def test_unlink(self, adapter, lo_ids_factory, psql, db):
+    def test_unlink(self, adapter, lo_ids_factory, cluster_db, sql_scalar, db):
         lo_id = lo_ids_factory(db=db)[0]
         with adapter.lobject(lo_id, "rw") as lobject_rw:
             lobject_rw.unlink()
             adapter.commit()
-        assert self.get_current(psql, db, lo_id) == ""
+        assert self.get_current(cluster_db, sql_scalar, lo_id) == b""
 
         with pytest.raises(Exception):
             with adapter.lobject(lo_id, "r") as lobject_r:
@@ -150,29 +199,39 @@ class TestLargeObject:
         with adapter.lobject(lo_id, "b") as lobject_r:
             assert lobject_r.read() == bytes("foobar\n", encoding="UTF8")
 
-    def test_write(self, adapter, lo_ids_factory, psql, db):
+    def test_write(self, adapter, lo_ids_factory, cluster_db, sql_scalar, db):
         lo_id = lo_ids_factory(db=db)[0]
         with adapter.lobject(lo_id, "rw") as lobject_rw:
             lobject_rw.write(b"new data")
             adapter.commit()
-        assert self.get_current(psql, db, lo_id) == "new data"
+        assert self.get_current(cluster_db, sql_scalar, lo_id) == b"new data"
 
         with pytest.raises(Exception):
             with adapter.lobject(lo_id, "r") as lobject_r:
                 with pytest.raises(Exception):
                     lobject_r.write(b"new data2")
 
-    def test_truncate(self, adapter, lo_ids_factory, psql, db):
+    def test_write_from(self, adapter, lo_ids_factory, db):
+        lo_id = lo_ids_factory(db=db)[0]
+        payload = os.urandom(4 * 1024 * 1024)
+        with adapter.lobject(lo_id, "wb") as lobject_w:
+            chunks = (payload[i : i + 4096] for i in range(0, len(payload), 4096))
+            assert lobject_w.write_from(chunks) == len(payload)
+            adapter.commit()
+        with adapter.lobject(lo_id, "rb") as lobject_r:
+            assert lobject_r.read() == payload
+
+    def test_truncate(self, adapter, lo_ids_factory, cluster_db, sql_scalar, db):
         lo_id = lo_ids_factory(db=db)[0]
         with adapter.lobject(lo_id, "rw") as lobject_rw:
             lobject_rw.truncate(length=1)
             adapter.commit()
-        assert self.get_current(psql, db, lo_id) == "f"
+        assert self.get_current(cluster_db, sql_scalar, lo_id) == b"f"
 
         with adapter.lobject(lo_id, "rw") as lobject_rw:
             lobject_rw.truncate()
             adapter.commit()
-        assert self.get_current(psql, db, lo_id) == ""
+        assert self.get_current(cluster_db, sql_scalar, lo_id) == b""
 
         with pytest.raises(Exception):
             with adapter.lobject(lo_id, "r") as lobject_r:
@@ -1,11 +1,26 @@
+import shlex
 import pytest
 import doctest
 from pgmob.backup import FileBackup, FileRestore
 from pgmob.errors import PostgresShellCommandError
 
 
-def cleanup_file(container, file):
-    container.exec_run(f"rm -f '{file}'")
+def cleanup_files(container, files):
+    if files:
+        container.exec_run(["sh", "-c", "rm -f " + " ".join(shlex.quote(f) for f in files)])
+
+
+def file_exists(container, path) -> bool:
+    """Checks that a regular file exists in the container, without running a shell"""
+    return container.exec_run(["test", "-f", path]).exit_code == 0
+
+
+@pytest.fixture
+def tmp_files(container):
+    """List of container file paths that are removed after the test"""
+    files = []
+    yield files
+    cleanup_files(container, files)
 
 
 @pytest.fixture
@@ -21,23 +36,19 @@ def backup(container):
 
     yield TestBackup
 
-    for file in TestBackup.files:
-        container.exec_run(f"rm -f '{file}'")
+    cleanup_files(container, TestBackup.files)
 
 
 class TestBackupFile:
-    def test_file_base_path_backup(self, connect, db_with_table, container):
+    def test_file_base_path_backup(self, cluster, db_with_table, tmp_files, container):
         path = "/tmp/" + db_with_table
-        cluster = connect()
-        cleanup_file(container, path)
+        tmp_files.append(path)
         backup = FileBackup(cluster=cluster, base_path="/tmp")
         backup.backup(database=db_with_table, path=db_with_table)
-        assert cluster.run_os_command(f"ls {path}").text == path
-        cleanup_file(container, path)
+        assert file_exists(container, path)
 
-    def test_nonexistent_base_path_backup(self, connect, db_with_table):
+    def test_nonexistent_base_path_backup(self, cluster, db_with_table):
         path = "/nonexistingpath/" + db_with_table
-        cluster = connect()
         backup = FileBackup(cluster=cluster, base_path="/nonexistingpath/")
         pytest.raises(
             PostgresShellCommandError,
@@ -46,18 +57,15 @@ class TestBackupFile:
             path=db_with_table,
         )
 
-    def test_file_absolute_backup(self, connect, db_with_table, container):
+    def test_file_absolute_backup(self, cluster, db_with_table, tmp_files, container):
         path = "/tmp/" + db_with_table
-        cluster = connect()
-        cleanup_file(container, path)
+        tmp_files.append(path)
         backup = FileBackup(cluster=cluster)
         backup.backup(database=db_with_table, path=path)
-        assert cluster.run_os_command(f"ls {path}").text == path
-        cleanup_file(container, path)
+        assert file_exists(container, path)
 
-    def test_nonexistent_absolute_backup(self, connect, db_with_table):
+    def test_nonexistent_absolute_backup(self, cluster, db_with_table):
         path = "/nonexistingpath/" + db_with_table
-        cluster = connect()
         backup = FileBackup(cluster=cluster)
         pytest.raises(
             PostgresShellCommandError,
@@ -68,8 +76,7 @@ class TestBackupFile:
 
 
 class TestRestoreFile:
-    def test_nonexistent_restore(self, connect, new_db):
-        cluster = connect()
+    def test_nonexistent_restore(self, cluster, new_db):
         restore = FileRestore(cluster=cluster, base_path="/tmp")
         pytest.raises(
             PostgresShellCommandError,
@@ -78,8 +85,7 @@ class TestRestoreFile:
             path="foo",
         )
 
-    def test_nonexistent_absolute_restore(self, connect, new_db):
-        cluster = connect()
+    def test_nonexistent_absolute_restore(self, cluster, new_db):
         restore = FileRestore(cluster=cluster)
         pytest.raises(
             PostgresShellCommandError,
@@ -88,15 +94,13 @@ class TestRestoreFile:
             path="/tmp/foo",
         )
 
-    def test_file_base_path_restore(self, connect, db_with_table, backup, new_db, container):
+    def test_file_base_path_restore(self, cluster, connect, db_with_table, backup, new_db):
         path = "/tmp/" + db_with_table
         backup.dump(db_with_table, path)
-        cluster = connect()
         restore = FileRestore(cluster=cluster, base_path="/tmp")
         restore.restore(database=new_db, path=db_with_table)
         db = connect(db=new_db)
         assert "test" in db.tables
-        cleanup_file(container, path)
 
 
 def test_doctest(doctest_globs_factory):
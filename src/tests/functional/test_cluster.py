@@ -6,23 +6,22 @@ import doctest
 
 @pytest.fixture
 def db_table_owner(psql, db, role):
-    psql(f"ALTER DATABASE {db} OWNER TO {role}")
-    psql(f"set role {role}; CREATE TABLE tmpzzz(a int)", db=db)
+    psql(f"ALTER DATABASE {db} OWNER TO {role}; SET ROLE {role}; CREATE TABLE tmpzzz(a int)", db=db)
     yield role
 
 
 class TestCluster:
-    database_query = "SELECT datname from pg_database WHERE datname = '{db}'"
-    role_query = "SELECT rolname, rolsuper, rolreplication ,rolcanlogin, rolconnlimit from pg_roles WHERE rolname = '{role}'"
-    replication_slot_query = "SELECT slot_name, plugin from pg_replication_slots WHERE slot_name = '{slot}'"
+    database_query = "SELECT datname from pg_database WHERE datname = %s"
+    role_query = (
+        "SELECT rolname, rolsuper, rolreplication ,rolcanlogin, rolconnlimit from pg_roles WHERE rolname = %s"
+    )
+    replication_slot_query = "SELECT slot_name, plugin from pg_replication_slots WHERE slot_name = %s"
     dat_owner_query = (
         "SELECT r.rolname FROM pg_catalog.pg_database d"
         " JOIN pg_catalog.pg_roles r on d.datdba = r.oid"
-        " WHERE d.datname = '{db}'"
-    )
-    table_owner_query = (
-        "SELECT tableowner FROM pg_tables WHERE tablename = '{name}' AND schemaname = '{schema}'"
+        " WHERE d.datname = %s"
     )
+    table_owner_query = "SELECT tableowner FROM pg_tables WHERE tablename = %s AND schemaname = %s"
 
     def test_init(self, cluster: Cluster):
         assert cluster.adapter.connection is not None
@@ -36,9 +35,9 @@ class TestCluster:
         assert cluster_db.current_database == db
         assert cluster_db.version >= util.Version("10")
 
-    def test_run_os_command_pwd(self, cluster: Cluster, psql):
+    def test_run_os_command_pwd(self, cluster: Cluster, sql_scalar):
         result = cluster.run_os_command("pwd").text
-        assert result == psql("select setting from pg_settings where name = 'data_directory'").output
+        assert result == sql_scalar(cluster, "SHOW data_directory")
 
     def test_run_os_command_escape(self, cluster: Cluster):
         result = cluster.run_os_command('''echo "\\",'"''').text
@@ -66,17 +65,18 @@ class TestCluster:
         assert result.text == "foo"
 
     def test_run_os_command_variables(self, cluster: Cluster):
-        def test(cmd, result):
-            assert cluster.run_os_command(cmd).text == result
-
-        for x in [
-            # escaped variable
-            ("export whatisthisvar=foo; echo \\$whatisthisvar", "foo"),
-            # variable substitutions
-            ("echo $HOME", "/var/lib/postgresql"),
-            ("echo $(whoami)", "postgres"),
-        ]:
-            test(*x)
+        # all cases run in a single shell command, their outputs are separated by a marker line
+        cmd = "; echo ---; ".join(
+            [
+                # escaped variable
+                "export whatisthisvar=foo; echo \\$whatisthisvar",
+                # variable substitutions
+                "echo $HOME",
+                "echo $(whoami)",
+            ]
+        )
+        result = cluster.run_os_command(cmd).text
+        assert result.split("\n---\n") == ["foo", "/var/lib/postgresql", "postgres"]
 
     def test_execute(self, cluster: Cluster):
         def test(query, param, result):
@@ -96,24 +96,24 @@ class TestCluster:
         ]:
             test(*x)
 
-    def test_rename_database(self, cluster: Cluster, old_db, new_db, psql):
-        psql(f"DROP DATABASE {new_db}")
+    def test_rename_database(self, cluster: Cluster, old_db, new_db):
+        cluster.databases[new_db].drop()
         db = cluster.databases[old_db]
         db.name = new_db
         db.alter()
-        assert psql(self.database_query.format(db=new_db)).output == new_db
-        assert psql(self.database_query.format(db=old_db)).output == ""
+        assert cluster.execute(self.database_query, new_db) == [(new_db,)]
+        assert cluster.execute(self.database_query, old_db) == []
 
-    def test_create_database(self, cluster: Cluster, new_db, psql):
-        psql(f"DROP DATABASE {new_db}")
-        assert psql(self.database_query.format(db=new_db)).output == ""
+    def test_create_database(self, cluster: Cluster, new_db):
+        cluster.databases[new_db].drop()
+        assert cluster.execute(self.database_query, new_db) == []
         cluster.databases.new(name=new_db).create()
-        assert psql(self.database_query.format(db=new_db)).output == new_db
+        assert cluster.execute(self.database_query, new_db) == [(new_db,)]
 
-    def test_drop_database(self, cluster: Cluster, new_db, psql):
-        assert psql(self.database_query.format(db=new_db)).output == new_db
+    def test_drop_database(self, cluster: Cluster, new_db):
+        assert cluster.execute(self.database_query, new_db) == [(new_db,)]
         cluster.databases[new_db].drop()
-        assert psql(self.database_query.format(db=new_db)).output == ""
+        assert cluster.execute(self.database_query, new_db) == []
 
     def test_terminate(self, cluster: Cluster):
         result = cluster.terminate(
@@ -138,9 +138,9 @@ class TestCluster:
             replication=False,
             login=False,
         ).create()
-        assert psql(self.role_query.format(role=role)).output == f"{role}|f|f|f|{limit}"
+        assert cluster.execute(self.role_query, role) == [(role, False, False, False, limit)]
 
-    def test_alter_role(self, cluster: Cluster, psql, role: str):
+    def test_alter_role(self, cluster: Cluster, role: str):
         limit = 20
         role_obj = cluster.roles[role]
         role_obj.connection_limit = limit
@@ -148,23 +148,21 @@ class TestCluster:
         role_obj.login = False
         role_obj.replication = False
         role_obj.alter()
-        assert psql(self.role_query.format(role=role)).output == f"{role}|f|f|f|{limit}"
+        assert cluster.execute(self.role_query, role) == [(role, False, False, False, limit)]
 
-    def test_drop_role(self, cluster: Cluster, psql, role):
+    def test_drop_role(self, cluster: Cluster, role):
         cluster.roles[role].drop()
-        result = psql(self.role_query.format(role=role)).output
-        assert result == ""
+        assert cluster.execute(self.role_query, role) == []
 
     def test_create_replication_slot(self, replication_slot, plugin, db, psql, cluster_db: Cluster):
         psql(f"SELECT pg_drop_replication_slot('{replication_slot}')", db=db)
         cluster_db.replication_slots.new(name=replication_slot, plugin=plugin).create()
-        result = psql(self.replication_slot_query.format(slot=replication_slot)).output
-        assert result == f"{replication_slot}|{plugin}"
+        result = cluster_db.execute(self.replication_slot_query, replication_slot)
+        assert result == [(replication_slot, plugin)]
 
-    def test_drop_replication_slot(self, replication_slot, psql, cluster_db: Cluster):
+    def test_drop_replication_slot(self, replication_slot, cluster_db: Cluster):
         cluster_db.replication_slots[replication_slot].drop()
-        result = psql(self.replication_slot_query.format(slot=replication_slot)).output
-        assert result == ""
+        assert cluster_db.execute(self.replication_slot_query, replication_slot) == []
 
     def test_roles(self, cluster: Cluster, role):
         assert isinstance(cluster.roles, objects.RoleCollection)
@@ -174,20 +172,18 @@ class TestCluster:
         assert isinstance(cluster.databases, objects.DatabaseCollection)
         assert db in cluster.databases
 
-    def test_reassign_owner(self, role, db, psql, cluster_db: Cluster, db_table_owner):
+    def test_reassign_owner(self, role, db, cluster_db: Cluster, db_table_owner):
         cluster_db.reassign_owner(owner=role, new_owner="postgres")
-        assert psql(self.dat_owner_query.format(db=db)).output == "postgres"
-        results = psql(self.table_owner_query.format(name="tmpzzz", schema="public"), db=db).output
-        assert results == "postgres"
+        assert cluster_db.execute(self.dat_owner_query, db) == [("postgres",)]
+        assert cluster_db.execute(self.table_owner_query, ("tmpzzz", "public")) == [("postgres",)]
 
-    def test_reassign_owner_objects(self, db, psql, cluster_db: Cluster, db_table_owner):
+    def test_reassign_owner_objects(self, db, cluster_db: Cluster, db_table_owner):
         cluster_db.reassign_owner(
             objects=[cluster_db.databases[db], cluster_db.tables["tmpzzz"]],
             new_owner="postgres",
         )
-        assert psql(self.dat_owner_query.format(db=db)).output == "postgres"
-        results = psql(self.table_owner_query.format(name="tmpzzz", schema="public"), db=db).output
-        assert results == "postgres"
+        assert cluster_db.execute(self.dat_owner_query, db) == [("postgres",)]
+        assert cluster_db.execute(self.table_owner_query, ("tmpzzz", "public")) == [("postgres",)]
 
     def test_doctest(self, doctest_globs_factory):
         from pgmob import cluster as cluster_module
@@ -12,7 +12,7 @@ class TestFunctionalDatabase:
     database_query = (
         "SELECT {field} FROM pg_catalog.pg_database d"
         " JOIN pg_catalog.pg_roles r on d.datdba = r.oid"
-        " WHERE d.datname = '{db}'"
+        " WHERE d.datname = %s"
     )
 
     def test_init(self, db, databases: objects.DatabaseCollection):
@@ -34,37 +34,36 @@ class TestFunctionalDatabase:
         assert str(db_item) == f"Database('{db}')"
 
     # setters
-    def test_owner(self, db, databases: objects.DatabaseCollection, role, psql):
+    def test_owner(self, db, databases: objects.DatabaseCollection, role, cluster):
         db_obj = databases[db]
         db_obj.owner = role
         assert db_obj.owner == role
-        assert psql(self.database_query.format(field="r.rolname", db=db)).output == "postgres"
+        assert cluster.execute(self.database_query.format(field="r.rolname"), db) == [("postgres",)]
         db_obj.alter()
-        assert psql(self.database_query.format(field="r.rolname", db=db)).output == role
+        assert cluster.execute(self.database_query.format(field="r.rolname"), db) == [(role,)]
         assert db_obj.owner == role
-        psql(f"DROP DATABASE {db}")
 
-    def test_name(self, old_db, databases: objects.DatabaseCollection, psql, new_db):
-        assert psql(f"DROP DATABASE {new_db}").exit_code == 0
+    def test_name(self, old_db, new_db, databases: objects.DatabaseCollection, cluster):
+        databases[new_db].drop()
         db_obj = databases[old_db]
         db_obj.name = "tmpdoittwice"
         db_obj.name = new_db
         assert db_obj.name == new_db
-        assert psql(self.database_query.format(field="d.datname", db=old_db)).output == old_db
+        assert cluster.execute(self.database_query.format(field="d.datname"), old_db) == [(old_db,)]
         db_obj.alter()
         assert db_obj.name == new_db
         databases.refresh()
         db_obj = databases[new_db]
-        assert psql(self.database_query.format(field="d.datname", db=new_db)).output == new_db
+        assert cluster.execute(self.database_query.format(field="d.datname"), new_db) == [(new_db,)]
         assert db_obj.name == new_db
 
     # methods
-    def test_create(self, role, db, databases: objects.DatabaseCollection, psql):
-        psql(f"DROP DATABASE {db}")
+    def test_create(self, role, db, databases: objects.DatabaseCollection, cluster):
+        databases[db].drop()
         db_obj = databases.new(name=db, owner=role, template="template0", is_template=False)
         db_obj.create()
         assert db_obj.oid > 0
-        assert psql(self.database_query.format(field="r.rolname", db=db)).output == role
+        assert cluster.execute(self.database_query.format(field="r.rolname"), db) == [(role,)]
 
     def test_script(self, db, databases: objects.DatabaseCollection, psql):
         db_obj = databases[db]
@@ -1,6 +1,17 @@
+import io
+import tarfile
 from pgmob import objects
 
 
+def _hba_lines(container) -> list:
+    """Returns raw pg_hba.conf lines from the container, read through the archive API without running a shell"""
+    bits, _ = container.get_archive("/var/lib/postgresql/data/pg_hba.conf")
+    with tarfile.open(fileobj=io.BytesIO(b"".join(bits))) as tar:
+        member = tar.extractfile("pg_hba.conf")
+        assert member is not None
+        return member.read().splitlines()
+
+
 class TestHBARules:
     def test_init(self, cluster):
         rules = objects.HBARuleCollection(cluster=cluster)
@@ -19,14 +30,10 @@ class TestHBARules:
         rules.alter()
         rules.refresh()
         assert "local postgres postgres any" in rules
-        assert "local   postgres   postgres   any" in container.exec_run(
-            f"cat /var/lib/postgresql/data/pg_hba.conf"
-        ).output.decode("utf8").split("\n")
+        assert b"local   postgres   postgres   any" in _hba_lines(container)
         # remove rule
         rules.remove(objects.HBARule(rule))
         rules.alter()
         rules.refresh()
         assert "local postgres postgres any" not in rules
-        assert "local   postgres   postgres   any" not in container.exec_run(
-            f"cat /var/lib/postgresql/data/pg_hba.conf"
-        ).output.decode("utf8").split("\n")
+        assert b"local   postgres   postgres   any" not in _hba_lines(container)
@@ -1,3 +1,5 @@
+import hashlib
+import os
 import pytest
 from pgmob import objects
 
@@ -14,8 +16,10 @@ class TestLargeObjects:
         "SELECT {field} "
         "FROM pg_largeobject_metadata lo "
         "JOIN pg_catalog.pg_roles r on lo.lomowner = r.oid "
-        "WHERE lo.oid = '{oid}'"
+        "WHERE lo.oid = %s"
     )
+    # first page of the large object contents, enough for the short values written by the tests
+    data_query = "SELECT data FROM pg_largeobject WHERE loid = %s AND pageno = 0"
 
     def test_init(self, large_objects, lo_ids):
         for lo_id in lo_ids:
@@ -23,49 +27,51 @@ class TestLargeObjects:
             assert largeobject.owner == "postgres"
             assert largeobject.oid == lo_id
 
-    def test_owner(self, large_objects, lo_ids, psql, role):
+    def test_owner(self, large_objects, lo_ids, role, cluster):
         lo_id = lo_ids[0]
 
         def get_current():
-            return psql(
-                self.lo_query.format(field="r.rolname", oid=lo_id),
-            ).output
+            return cluster.execute(self.lo_query.format(field="r.rolname"), lo_id)
 
         largeobject = large_objects[lo_id]
         largeobject.owner = role
-        assert get_current() == "postgres"
+        assert get_current() == [("postgres",)]
         largeobject.alter()
-        assert get_current() == role
+        assert get_current() == [(role,)]
         assert largeobject.owner == role
-        psql(f"\\lo_unlink {lo_id}")
+        largeobject.drop()
 
-    def test_drop(self, large_objects, lo_ids, psql):
+    def test_drop(self, large_objects, lo_ids, cluster):
         def get_current(oid):
-            return psql(
-                self.lo_query.format(field="lo.oid", oid=oid),
-            ).output
+            return cluster.execute(self.lo_query.format(field="lo.oid"), oid)
 
         for lo in lo_ids:
             large_objects[lo].drop()
-            assert get_current(lo) == ""
+            assert get_current(lo) == []
 
     def test_read(self, large_objects, lo_ids):
         for lo in lo_ids:
             assert large_objects[lo].read() in ["foobar\n", "zoobar\n"]
 
-    def test_write(self, large_objects, lo_ids, psql):
+    def test_write(self, large_objects, lo_ids, cluster, sql_scalar):
         lo_id = lo_ids[0]
         large_objects[lo_id].write(b"new data")
-        lo = psql(f"SELECT encode(data, 'escape') FROM pg_largeobject WHERE loid = {lo_id}")
-        assert lo.output == "new data"
+        assert bytes(sql_scalar(cluster, self.data_query, (lo_id,))) == b"new data"
 
-    def test_truncate(self, large_objects, lo_ids, psql):
+    def test_write_from(self, large_objects, lo_ids, cluster, sql_scalar):
+        lo_id = lo_ids[0]
+        payload = os.urandom(4 * 1024 * 1024)
+        large_objects[lo_id].write_from(payload[i : i + 4096] for i in range(0, len(payload), 4096))
+        assert sql_scalar(cluster, "SELECT md5(lo_get(%s))", (lo_id,)) == hashlib.md5(payload).hexdigest()
+
+    def test_truncate(self, large_objects, lo_ids, cluster, sql_scalar):
         lo_id = lo_ids[0]
 
         def get_current():
-            return psql(f"SELECT encode(data, 'escape') FROM pg_largeobject WHERE loid = {lo_id}").output
+            return sql_scalar(cluster, self.data_query, (lo_id,))
 
         large_objects[lo_id].truncate(len=1)
-        assert get_current() == "f"
+        assert bytes(get_current()) == b"f"
         large_objects[lo_id].truncate()
-        assert get_current() == ""
+        # an empty large object has no data pages
+        assert get_current() is None
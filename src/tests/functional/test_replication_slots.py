@@ -2,10 +2,9 @@ from pgmob import objects
 
 
 class TestFunctionalReplicationSlot:
-    slot_query = "SELECT {field} FROM pg_catalog.pg_replication_slots" " WHERE slot_name = '{slot}'"
+    slot_query = "SELECT {field} FROM pg_catalog.pg_replication_slots" " WHERE slot_name = %s"
 
-    def test_init(self, connect, replication_slot, plugin, db):
-        cluster = connect()
+    def test_init(self, cluster, replication_slot, plugin, db):
         slots = objects.ReplicationSlotCollection(cluster=cluster)
         slot_item = slots[replication_slot]
         assert slot_item.name == replication_slot
@@ -21,16 +20,14 @@ class TestFunctionalReplicationSlot:
         assert slot_item.confirmed_flush_lsn is not None
         assert str(slot_item) == f"ReplicationSlot('{replication_slot}')"
 
-    def test_drop(self, connect, replication_slot, db, psql):
-        cluster = connect()
+    def test_drop(self, cluster, replication_slot, db, sql_scalar):
         slots = objects.ReplicationSlotCollection(cluster=cluster)
         slots[replication_slot].drop()
         slots.refresh()
         assert replication_slot not in slots
-        assert psql(self.slot_query.format(field="slot_name", slot=replication_slot)).output == ""
+        assert sql_scalar(cluster, self.slot_query.format(field="slot_name"), (replication_slot,)) is None
 
-    def test_script(self, connect, replication_slot, plugin):
-        cluster = connect()
+    def test_script(self, cluster, replication_slot, plugin):
         slots = objects.ReplicationSlotCollection(cluster=cluster)
         assert slots[
             replication_slot
@@ -38,17 +35,16 @@ class TestFunctionalReplicationSlot:
             "utf8"
         )
 
-    def test_create(self, connect, db, psql, plugin):
+    def test_create(self, connect, db, sql_scalar, plugin):
         cluster = connect(db=db)
         slots = objects.ReplicationSlotCollection(cluster=cluster)
         slot = slots.new(name="foobar", plugin=plugin)
         slot.create()
         slots.refresh()
         assert "foobar" in slots
-        assert psql(self.slot_query.format(field="slot_name", slot="foobar")).output == "foobar"
+        assert sql_scalar(cluster, self.slot_query.format(field="slot_name"), ("foobar",)) == "foobar"
 
-    def test_disconnect(self, connect, replication_slot, psql):
-        cluster = connect()
+    def test_disconnect(self, cluster, replication_slot, sql_scalar):
         slots = objects.ReplicationSlotCollection(cluster=cluster)
         slots[replication_slot].disconnect()
-        assert psql(self.slot_query.format(field="active_pid", slot=replication_slot)).output == ""
+        assert sql_scalar(cluster, self.slot_query.format(field="active_pid"), (replication_slot,)) is None
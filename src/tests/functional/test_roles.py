@@ -5,6 +5,9 @@ import pytest
 from pgmob import objects
 
 
+_MD5_RE = re.compile(r"^md5\w{32}$")
+
+
 @pytest.fixture
 def tmp_role(test_role):
     """Creates a temporary user pgmobtest"""
@@ -25,7 +28,7 @@ def roles(cluster, tmp_role):
 
 
 class TestFunctionalRoles:
-    role_query = "SELECT {field} FROM pg_catalog.pg_roles" " WHERE rolname = '{role}'"
+    role_query = "SELECT {field} FROM pg_catalog.pg_roles WHERE rolname = %s"
 
     def test_roles(self, roles: objects.RoleCollection, tmp_role: str):
         day = date.today()
@@ -45,26 +48,25 @@ class TestFunctionalRoles:
 
     # methods
     def test_get_password_md5(self, roles: objects.RoleCollection, tmp_role: str):
-        role_item = roles[tmp_role]
-        assert isinstance(role_item.get_password_md5(), str)
-        assert re.search("^md5\\w{32}$", role_item.get_password_md5())
+        password = roles[tmp_role].get_password_md5()
+        assert isinstance(password, str)
+        assert _MD5_RE.match(password)
 
-    def test_name(self, test_role, roles: objects.RoleCollection, psql, tmp_role):
+    def test_name(self, test_role, roles: objects.RoleCollection, cluster, sql_scalar, psql, tmp_role):
         renamed = test_role.create("pgmobrenamerole")
         assert psql("DROP ROLE pgmobrenamerole").exit_code == 0
         role_obj = roles[tmp_role]
-        role_obj.name = "tmpdoittwice"
         role_obj.name = renamed
         assert role_obj.name == renamed
-        assert psql(self.role_query.format(field="rolname", role=tmp_role)).output == tmp_role
+        assert sql_scalar(cluster, self.role_query.format(field="rolname"), (tmp_role,)) == tmp_role
         role_obj.alter()
-        assert psql(self.role_query.format(field="rolname", role=tmp_role)).output == ""
+        assert sql_scalar(cluster, self.role_query.format(field="rolname"), (tmp_role,)) is None
         assert role_obj.name == renamed
         roles.refresh()
         role_obj = roles[renamed]
-        assert psql(self.role_query.format(field="rolname", role=renamed)).output == renamed
+        assert sql_scalar(cluster, self.role_query.format(field="rolname"), (renamed,)) == renamed
 
-    def test_create(self, tmp_role, roles: objects.RoleCollection, psql):
+    def test_create(self, tmp_role, roles: objects.RoleCollection, cluster, sql_scalar, psql):
         psql(f"DROP ROLE {tmp_role}")
         day = date.today()
         role_obj = roles.new(
@@ -72,10 +74,10 @@ class TestFunctionalRoles:
         )
         role_obj.create()
         assert role_obj.oid > 0
-        assert psql(self.role_query.format(field="rolname", role=tmp_role)).output == tmp_role
-        assert psql(self.role_query.format(field="rolvaliduntil::date", role=tmp_role)).output == str(day)
-        assert psql(self.role_query.format(field="rolcreatedb", role=tmp_role)).output == "t"
-        assert psql(self.role_query.format(field="rolconnlimit", role=tmp_role)).output == "2"
+        assert sql_scalar(cluster, self.role_query.format(field="rolname"), (tmp_role,)) == tmp_role
+        assert sql_scalar(cluster, self.role_query.format(field="rolvaliduntil::date"), (tmp_role,)) == day
+        assert sql_scalar(cluster, self.role_query.format(field="rolcreatedb"), (tmp_role,)) == True
+        assert sql_scalar(cluster, self.role_query.format(field="rolconnlimit"), (tmp_role,)) == 2
 
     def test_script(self, tmp_role, roles: objects.RoleCollection, psql):
         role_obj = roles[tmp_role]
@@ -83,8 +85,8 @@ class TestFunctionalRoles:
             "CREATE ROLE.*CREATEROLE.*LOGIN.*CONNECTION LIMIT.*VALID UNTIL", role_obj.script().decode("utf8")
         )
 
-    def test_change_password(self, tmp_role: str, roles: objects.RoleCollection, psql):
-        pw_query = f"SELECT rolpassword FROM pg_catalog.pg_authid WHERE rolname = '{tmp_role}'"
-        old_pw = psql(pw_query).output
+    def test_change_password(self, tmp_role: str, roles: objects.RoleCollection, cluster, sql_scalar):
+        pw_query = "SELECT rolpassword FROM pg_catalog.pg_authid WHERE rolname = %s"
+        old_pw = sql_scalar(cluster, pw_query, (tmp_role,))
         roles[tmp_role].change_password("foobar")
-        assert psql(pw_query).output != old_pw
+        assert sql_scalar(cluster, pw_query, (tmp_role,)) != old_pw
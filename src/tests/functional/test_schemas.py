@@ -4,15 +4,15 @@ from pgmob import objects
 
 
 @pytest.fixture
-def schemas(psql, db, cluster_db):
+def schemas(cluster_db, sql_batch):
     """Creates a set of schemas"""
     schema_list = [
         "tmp",
         "tmp-2",
     ]
-    for s in schema_list:
-        psql(f'CREATE SCHEMA "{s}"', db=db)
-    psql(f'CREATE TABLE "tmp-2".a (a int)', db=db)
+    statements = [f'CREATE SCHEMA "{s}"' for s in schema_list]
+    statements.append('CREATE TABLE "tmp-2".a (a int)')
+    sql_batch(cluster_db, statements)
 
     schemas = objects.SchemaCollection(cluster=cluster_db)
     yield schemas
@@ -23,7 +23,7 @@ class TestSchemas:
         "SELECT {field} "
         "FROM pg_catalog.pg_namespace n "
         "JOIN pg_catalog.pg_roles r on n.nspowner = r.oid "
-        "WHERE n.nspname = '{schema}'"
+        "WHERE n.nspname = %s"
     )
 
     def test_init(self, schemas):
@@ -37,12 +37,9 @@ class TestSchemas:
         assert schema.owner == "postgres"
         assert schema.oid > 0
 
-    def test_owner(self, schemas, psql, db, role):
+    def test_owner(self, schemas, cluster_db, sql_scalar, role):
         def get_current():
-            return psql(
-                self.schema_query.format(field="r.rolname", schema="tmp"),
-                db=db,
-            ).output
+            return sql_scalar(cluster_db, self.schema_query.format(field="r.rolname"), ("tmp",))
 
         schema = schemas["tmp"]
         schema.owner = role
@@ -50,17 +47,12 @@ class TestSchemas:
         schema.alter()
         assert get_current() == role
         assert schema.owner == role
-        assert psql("DROP SCHEMA tmp CASCADE", db=db).exit_code == 0
 
-    def test_name(self, schemas, psql, db):
+    def test_name(self, schemas, cluster_db, sql_scalar):
         def get_current(schema):
-            return psql(
-                self.schema_query.format(field="n.nspname", schema=schema),
-                db=db,
-            ).output
+            return sql_scalar(cluster_db, self.schema_query.format(field="n.nspname"), (schema,))
 
         schema = schemas["tmp"]
-        schema.name = "tmpdoittwice"
         schema.name = "tmprenamed"
         assert get_current("tmp") == "tmp"
         schema.alter()
@@ -69,31 +61,27 @@ class TestSchemas:
         assert get_current("tmprenamed") == "tmprenamed"
         assert schema.name == "tmprenamed"
 
-    def test_drop(self, schemas, psql, db):
+    def test_drop(self, schemas, cluster_db, sql_scalar):
         def get_current(schema):
-            return psql(
-                self.schema_query.format(field="n.nspname", schema=schema),
-                db=db,
-            ).output
+            return sql_scalar(cluster_db, self.schema_query.format(field="n.nspname"), (schema,))
 
         assert get_current("tmp") == "tmp"
         assert get_current("tmp-2") == "tmp-2"
         schemas["tmp"].drop()
-        assert get_current("tmp") == ""
+        assert get_current("tmp") is None
         schemas["tmp-2"].drop(cascade=True)
-        assert get_current("tmp-2") == ""
+        assert get_current("tmp-2") is None
 
-    def test_create(self, schemas: objects.SchemaCollection, db, role, psql):
+    def test_create(self, schemas: objects.SchemaCollection, cluster_db, sql_scalar, db, role, psql):
         tmp_schema = schemas["tmp"].name
         assert psql(f"DROP SCHEMA {tmp_schema}", db=db).exit_code == 0
         schema_obj = schemas.new(name=tmp_schema, owner=role)
         schema_obj.create()
         assert schema_obj.oid > 0
         assert (
-            psql(self.schema_query.format(field="n.nspname", schema=tmp_schema), db=db).output == tmp_schema
+            sql_scalar(cluster_db, self.schema_query.format(field="n.nspname"), (tmp_schema,)) == tmp_schema
         )
-        assert psql(self.schema_query.format(field="r.rolname", schema=tmp_schema), db=db).output == role
-        assert psql(f"DROP SCHEMA {tmp_schema} CASCADE", db=db).exit_code == 0
+        assert sql_scalar(cluster_db, self.schema_query.format(field="r.rolname"), (tmp_schema,)) == role
 
     def test_script(self, schemas: objects.SchemaCollection):
         schema_obj = schemas["tmp"]
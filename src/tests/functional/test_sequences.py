@@ -3,7 +3,7 @@ from pgmob import objects
 
 
 @pytest.fixture
-def sequences(psql, db, cluster_db):
+def sequences(cluster_db, sql_batch):
     """Creates a set of sequences"""
     sequence_list = [
         "public.alterschema",
@@ -11,16 +11,16 @@ def sequences(psql, db, cluster_db):
         "public.rename",
         "public.props",
     ]
-    for s in sequence_list:
-        psql(f"CREATE SEQUENCE {s}", db=db)
-    psql("CREATE TABLE public.tmpzzz (a int GENERATED ALWAYS AS IDENTITY)", db=db)
+    statements = [f"CREATE SEQUENCE {s}" for s in sequence_list]
+    statements.append("CREATE TABLE public.tmpzzz (a int GENERATED ALWAYS AS IDENTITY)")
+    sql_batch(cluster_db, statements)
 
     seqs = objects.SequenceCollection(cluster=cluster_db)
     yield seqs
 
 
 class TestSequences:
-    sequence_query = "SELECT {field} FROM pg_catalog.pg_sequences WHERE sequencename = '{name}' AND schemaname = '{schema}'"
+    sequence_query = "SELECT {field} FROM pg_catalog.pg_sequences WHERE sequencename = %s AND schemaname = %s"
 
     def test_init(self, sequences):
         assert isinstance(sequences, objects.SequenceCollection)
@@ -51,30 +51,32 @@ class TestSequences:
         assert seq.currval() == 20
 
     # setters
-    def test_owner(self, sequences, psql, role, db):
+    def test_owner(self, sequences, cluster_db, sql_scalar, role):
         seq = sequences["ownertest"]
         seq.owner = role
         assert seq.owner == role
-        results = psql(
-            self.sequence_query.format(field="sequenceowner", name="ownertest", schema="public"),
-            db=db,
-        ).output
+        results = sql_scalar(
+            cluster_db,
+            self.sequence_query.format(field="sequenceowner"),
+            ("ownertest", "public"),
+        )
         assert results == "postgres"
         seq.alter()
-        results = psql(
-            self.sequence_query.format(field="sequenceowner", name="ownertest", schema="public"),
-            db=db,
-        ).output
+        results = sql_scalar(
+            cluster_db,
+            self.sequence_query.format(field="sequenceowner"),
+            ("ownertest", "public"),
+        )
         assert results == role
         assert seq.owner == role
-        assert psql("DROP SEQUENCE ownertest", db=db).exit_code == 0
 
-    def test_data_type(self, sequences, psql, db):
+    def test_data_type(self, sequences, cluster_db, sql_scalar):
         def get_current():
-            return psql(
-                self.sequence_query.format(field="data_type", name="props", schema="public"),
-                db=db,
-            ).output
+            return sql_scalar(
+                cluster_db,
+                self.sequence_query.format(field="data_type"),
+                ("props", "public"),
+            )
 
         seq = sequences["props"]
         seq.data_type = "smallint"
@@ -84,16 +86,12 @@ class TestSequences:
         assert get_current() == "smallint"
         assert seq.data_type == "smallint"
 
-    def test_values(self, sequences, psql, db):
+    def test_values(self, sequences, cluster_db):
         def get_current():
-            return psql(
-                self.sequence_query.format(
-                    field="min_value, start_value, max_value, increment_by",
-                    name="props",
-                    schema="public",
-                ),
-                db=db,
-            ).output
+            return cluster_db.execute(
+                self.sequence_query.format(field="min_value, start_value, max_value, increment_by"),
+                ("props", "public"),
+            )
 
         seq = sequences["props"]
         seq.start_value = 101
@@ -104,27 +102,23 @@ class TestSequences:
         assert seq.min_value == -11
         assert seq.max_value == 202
         assert seq.increment_by == 2
-        assert get_current() == "1|1|9223372036854775807|1"
+        assert get_current() == [(1, 1, 9223372036854775807, 1)]
         seq.alter()
-        assert get_current() == "-11|101|202|2"
+        assert get_current() == [(-11, 101, 202, 2)]
         assert seq.start_value == 101
         assert seq.min_value == -11
         assert seq.max_value == 202
         assert seq.increment_by == 2
 
-    def test_schema(self, sequences, psql, db, schema):
+    def test_schema(self, sequences, cluster_db, sql_scalar, schema):
         def get_current(schema="public"):
-            return psql(
-                self.sequence_query.format(
-                    field="schemaname",
-                    name="alterschema",
-                    schema=schema,
-                ),
-                db=db,
-            ).output
+            return sql_scalar(
+                cluster_db,
+                self.sequence_query.format(field="schemaname"),
+                ("alterschema", schema),
+            )
 
         seq = sequences["alterschema"]
-        seq.schema = "tmpdoittwice"
         seq.schema = schema
         assert seq.schema == schema
         assert get_current() == "public"
@@ -134,19 +128,15 @@ class TestSequences:
         assert get_current(schema) == schema
         assert seq.schema == schema
 
-    def test_name(self, sequences, psql, db):
+    def test_name(self, sequences, cluster_db, sql_scalar):
         def get_current(name="rename"):
-            return psql(
-                self.sequence_query.format(
-                    field="sequencename",
-                    name=name,
-                    schema="public",
-                ),
-                db=db,
-            ).output
+            return sql_scalar(
+                cluster_db,
+                self.sequence_query.format(field="sequencename"),
+                (name, "public"),
+            )
 
         seq = sequences["rename"]
-        seq.name = "tmpdoittwice"
         seq.name = "renamed"
         assert seq.name == "renamed"
         assert get_current() == "rename"
@@ -156,16 +146,13 @@ class TestSequences:
         assert get_current("renamed") == "renamed"
         assert seq.name == "renamed"
 
-    def test_drop(self, sequences, psql, db):
+    def test_drop(self, sequences, cluster_db, sql_scalar):
         sequences["props"].drop()
-        result = psql(
-            self.sequence_query.format(
-                field="schemaname",
-                name="props",
-                schema="public",
-            ),
-            db=db,
-        ).output
-        assert result == ""
+        result = sql_scalar(
+            cluster_db,
+            self.sequence_query.format(field="schemaname"),
+            ("props", "public"),
+        )
+        assert result is None
         # TODO: items should be dropped from collections as well
         # assert "props" not in sequences
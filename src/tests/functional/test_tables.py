@@ -3,7 +3,7 @@ from pgmob import objects
 
 
 @pytest.fixture
-def tables(psql, db, cluster_db, schema):
+def tables(cluster_db, schema, sql_batch):
     """Creates a set of tables"""
     table_list = [
         "public.tmpzzz",
@@ -11,41 +11,34 @@ def tables(psql, db, cluster_db, schema):
         "public.tmpyyy",
         "public.tmprename",
     ]
-    for t in table_list:
-        psql(f"CREATE TABLE {t} (a int GENERATED ALWAYS AS IDENTITY)", db=db)
+    sql_batch(cluster_db, (f"CREATE TABLE {t} (a int GENERATED ALWAYS AS IDENTITY)" for t in table_list))
 
     tables = objects.TableCollection(cluster=cluster_db)
     yield tables
 
 
 class TestTables:
-    table_query = (
-        "SELECT {field} FROM pg_catalog.pg_tables WHERE tablename = '{name}' AND schemaname = '{schema}'"
-    )
+    table_query = "SELECT {field} FROM pg_catalog.pg_tables WHERE tablename = %s AND schemaname = %s"
 
-    def test_init(self, tables):
-        tbl = tables["tmpzzz"]
-        assert tbl.name == "tmpzzz"
-        assert tbl.owner == "postgres"
-        assert tbl.schema == "public"
-        assert tbl.tablespace is None
-        assert tbl.row_security == False
-        assert tbl.oid > 0
-
-        tbl = tables["tmp.tmpzzz"]
+    @pytest.mark.parametrize(
+        "key, schema", [("tmpzzz", "public"), ("tmp.tmpzzz", "tmp")], ids=["public", "tmp"]
+    )
+    def test_init(self, tables, key, schema):
+        tbl = tables[key]
         assert tbl.name == "tmpzzz"
         assert tbl.owner == "postgres"
-        assert tbl.schema == "tmp"
+        assert tbl.schema == schema
         assert tbl.tablespace is None
         assert tbl.row_security == False
         assert tbl.oid > 0
 
-    def test_owner(self, tables, role, psql, db):
+    def test_owner(self, tables, cluster_db, sql_scalar, role):
         def get_current():
-            return psql(
-                self.table_query.format(field="tableowner", name="tmpzzz", schema="public"),
-                db=db,
-            ).output
+            return sql_scalar(
+                cluster_db,
+                self.table_query.format(field="tableowner"),
+                ("tmpzzz", "public"),
+            )
 
         tbl = tables["tmpzzz"]
         tbl.owner = role
@@ -54,48 +47,49 @@ class TestTables:
         tbl.alter()
         assert get_current() == role
         assert tbl.owner == role
-        assert psql("DROP TABLE tmpzzz", db=db).exit_code == 0
 
-    def test_tablespace(self, tables, psql, db, tablespace):
+    def test_tablespace(self, tables, cluster_db, sql_scalar, psql, db, tablespace):
         def get_current():
-            return psql(
-                self.table_query.format(field="tablespace", name="tmpzzz", schema="public"),
-                db=db,
-            ).output
+            return sql_scalar(
+                cluster_db,
+                self.table_query.format(field="tablespace"),
+                ("tmpzzz", "public"),
+            )
 
         tbl = tables["tmpzzz"]
         tbl.tablespace = tablespace
         assert tbl.tablespace == tablespace
-        assert get_current() == ""
+        assert get_current() is None
         tbl.alter()
         assert get_current() == tablespace
         assert tbl.tablespace == tablespace
         assert psql("DROP TABLE tmpzzz", db=db).exit_code == 0
 
-    def test_row_security(self, tables, psql, db):
+    def test_row_security(self, tables, cluster_db, sql_scalar):
         def get_current():
-            return psql(
-                self.table_query.format(field="rowsecurity", name="tmpzzz", schema="public"),
-                db=db,
-            ).output
+            return sql_scalar(
+                cluster_db,
+                self.table_query.format(field="rowsecurity"),
+                ("tmpzzz", "public"),
+            )
 
         tbl = tables["tmpzzz"]
         tbl.row_security = True
         assert tbl.row_security == True
-        assert get_current() == "f"
+        assert get_current() == False
         tbl.alter()
         assert tbl.row_security == True
-        assert get_current() == "t"
+        assert get_current() == True
 
-    def test_schema(self, tables, psql, db, schema):
+    def test_schema(self, tables, cluster_db, sql_scalar, schema):
         def get_current(schema="public"):
-            return psql(
-                self.table_query.format(field="schemaname", name="tmpyyy", schema=schema),
-                db=db,
-            ).output
+            return sql_scalar(
+                cluster_db,
+                self.table_query.format(field="schemaname"),
+                ("tmpyyy", schema),
+            )
 
         tbl = tables["tmpyyy"]
-        tbl.schema = "tmpdoittwice"
         tbl.schema = schema
         assert tbl.schema == schema
         assert get_current() == "public"
@@ -105,15 +99,15 @@ class TestTables:
         assert get_current(schema) == schema
         assert tbl.schema == schema
 
-    def test_name(self, tables, psql, db):
+    def test_name(self, tables, cluster_db, sql_scalar):
         def get_current(name):
-            return psql(
-                self.table_query.format(field="tablename", name=name, schema="public"),
-                db=db,
-            ).output
+            return sql_scalar(
+                cluster_db,
+                self.table_query.format(field="tablename"),
+                (name, "public"),
+            )
 
         tbl = tables["tmprename"]
-        tbl.name = "tmpdoittwice"
         tbl.name = "tmprenamed"
         assert tbl.name == "tmprenamed"
         assert get_current("tmprename") == "tmprename"
@@ -123,14 +117,15 @@ class TestTables:
         assert get_current("tmprenamed") == "tmprenamed"
         assert tbl.name == "tmprenamed"
 
-    def test_drop(self, tables, psql, db, schema):
+    def test_drop(self, tables, cluster_db, sql_scalar, schema):
         def get_current(schema="public"):
-            return psql(
-                self.table_query.format(field="tablename", name="tmpzzz", schema=schema),
-                db=db,
-            ).output
+            return sql_scalar(
+                cluster_db,
+                self.table_query.format(field="tablename"),
+                ("tmpzzz", schema),
+            )
 
         tables["tmpzzz"].drop()
-        assert get_current() == ""
+        assert get_current() is None
         tables[f"{schema}.tmpzzz"].drop(cascade=True)
-        assert get_current(schema) == ""
+        assert get_current(schema) is None
@@ -3,17 +3,16 @@ from pgmob import objects
 
 
 @pytest.fixture
-def views(psql, db, cluster_db, schema):
+def views(cluster_db, schema, sql_batch):
     """Creates a set of views"""
     view_list = ["public.tmpzzz", f"{schema}.tmpzzz", "public.tmpyyy", "public.tmprename"]
-    for v in view_list:
-        psql(f"CREATE VIEW {v} AS (SELECT 1 as a)", db=db)
+    sql_batch(cluster_db, (f"CREATE VIEW {v} AS (SELECT 1 as a)" for v in view_list))
     views = objects.ViewCollection(cluster=cluster_db)
     yield views
 
 
 class TestViews:
-    view_query = "SELECT {field} FROM pg_views WHERE viewname = '{name}' AND schemaname = '{schema}'"
+    view_query = "SELECT {field} FROM pg_views WHERE viewname = %s AND schemaname = %s"
 
     def test_init(self, views):
         view = views["tmpzzz"]
@@ -28,12 +27,9 @@ class TestViews:
         assert view.schema == "tmp"
         assert view.oid > 0
 
-    def test_owner(self, views, role, psql, db):
+    def test_owner(self, views, cluster_db, sql_scalar, role):
         def get_current():
-            return psql(
-                self.view_query.format(field="viewowner", name="tmpzzz", schema="public"),
-                db=db,
-            ).output
+            return sql_scalar(cluster_db, self.view_query.format(field="viewowner"), ("tmpzzz", "public"))
 
         view = views["tmpzzz"]
         view.owner = role
@@ -42,17 +38,12 @@ class TestViews:
         view.alter()
         assert get_current() == role
         assert view.owner == role
-        assert psql("DROP VIEW tmpzzz", db=db).exit_code == 0
 
-    def test_schema(self, views, schema, psql, db):
+    def test_schema(self, views, cluster_db, sql_scalar, schema):
         def get_current(schema="public"):
-            return psql(
-                self.view_query.format(field="schemaname", name="tmpyyy", schema=schema),
-                db=db,
-            ).output
+            return sql_scalar(cluster_db, self.view_query.format(field="schemaname"), ("tmpyyy", schema))
 
         view = views["tmpyyy"]
-        view.schema = "tmpdoittwice"
         view.schema = schema
         assert view.schema == schema
         assert get_current() == "public"
@@ -62,15 +53,11 @@ class TestViews:
         assert get_current(schema) == schema
         assert view.schema == schema
 
-    def test_name(self, views, psql, db):
+    def test_name(self, views, cluster_db, sql_scalar):
         def get_current(name):
-            return psql(
-                self.view_query.format(field="viewname", name=name, schema="public"),
-                db=db,
-            ).output
+            return sql_scalar(cluster_db, self.view_query.format(field="viewname"), (name, "public"))
 
         view = views["tmprename"]
-        view.name = "tmpdoittwice"
         view.name = "tmprenamed"
         assert view.name == "tmprenamed"
         assert get_current("tmprename") == "tmprename"
@@ -80,17 +67,14 @@ class TestViews:
         assert get_current("tmprenamed") == "tmprenamed"
         assert view.name == "tmprenamed"
 
-    def test_drop(self, views, psql, db, schema):
+    def test_drop(self, views, cluster_db, sql_scalar, schema):
         def get_current(schema="public"):
-            return psql(
-                self.view_query.format(field="viewname", name="tmpzzz", schema=schema),
-                db=db,
-            ).output
+            return sql_scalar(cluster_db, self.view_query.format(field="viewname"), ("tmpzzz", schema))
 
         views["tmpzzz"].drop()
-        assert get_current() == ""
+        assert get_current() is None
         views[f"{schema}.tmpzzz"].drop(cascade=True)
-        assert get_current(schema) == ""
+        assert get_current(schema) is None
 
         views.refresh()
         assert "tmpzzz" not in views
@@ -4,6 +4,8 @@ from pgmob.sql import SQL, Identifier
 from pgmob.cluster import Cluster
 from pgmob.objects import generic
 from pgmob.errors import PostgresShellCommandError
+from pgmob.adapters import ProgrammingError
+from pgmob.adapters.base import BaseAdapter
 from pgmob import objects, util
 import pytest
 
@@ -36,10 +38,8 @@ class TestCluster:
         db_name: str,
         cursor: MagicMock,
         cursor_fetch_version,
-        mocker: MockerFixture,
+        passthrough_query,
     ):
-
-        mocker.patch("pgmob.adapters.psycopg2.Psycopg2Cursor._convert_query", lambda _, x: x)
         cluster = Cluster(connection=psycopg2_connection, become="postgres")
         cursor.execute.assert_any_call(SQL("SET ROLE {role}").format(role=Identifier("postgres")), None)
         assert cluster.adapter.connection == psycopg2_connection
@@ -69,6 +69,49 @@ class TestCluster:
         cluster.execute_with_cursor(lambda x: x.execute(query, (param,)))
         cursor.execute.assert_called_with(query, (param,))
 
+    def test_execute_stream(self, cluster: Cluster, cursor, psycopg2_connection):
+        query = "SELECT foo FROM bar WHERE FOO = %s"
+        param = 5
+        cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)]]
+
+        result = list(cluster._execute_stream(query, param, name="foo", size=2))
+        assert result == [(1,), (2,), (3,)]
+        cursor.execute.assert_called_with(query, (param,))
+        assert cursor.fetchmany.call_count == 2
+        assert psycopg2_connection.cursor.call_args.kwargs["name"] == "foo"
+        psycopg2_connection.commit.assert_called()
+        psycopg2_connection.rollback.assert_not_called()
+        assert psycopg2_connection.autocommit is True
+
+    def test_execute_stream_error(self, cluster: Cluster, cursor, psycopg2_connection):
+        cursor.fetchmany.side_effect = [[(1,), (2,)], ProgrammingError("foo")]
+
+        with pytest.raises(ProgrammingError):
+            list(cluster._execute_stream("SELECT foo FROM bar", name="foo", size=2))
+        psycopg2_connection.rollback.assert_called()
+        psycopg2_connection.commit.assert_not_called()
+        assert psycopg2_connection.autocommit is True
+
+    def test_execute_stream_no_autocommit(self, cluster: Cluster, cursor, psycopg2_connection):
+        query = "SELECT foo FROM bar WHERE FOO = %s"
+        psycopg2_connection.autocommit = False
+        cursor.fetchall.return_value = [(1,), (2,)]
+
+        assert list(cluster._execute_stream(query, 5, name="foo")) == [(1,), (2,)]
+        cursor.execute.assert_called_with(query, (5,))
+        assert "name" not in psycopg2_connection.cursor.call_args.kwargs
+        cursor.fetchmany.assert_not_called()
+        assert psycopg2_connection.autocommit is False
+
+    def test_execute_stream_unsupported(self, cluster: Cluster, cursor, psycopg2_connection, monkeypatch):
+        monkeypatch.setattr(
+            cluster.adapter, "named_cursor", BaseAdapter.named_cursor.__get__(cluster.adapter)
+        )
+        cursor.fetchall.return_value = [(1,)]
+
+        assert list(cluster._execute_stream("SELECT 1", name="foo")) == [(1,)]
+        cursor.fetchmany.assert_not_called()
+
     def test_run_os_command(
         self,
         psycopg2_connection,
@@ -0,0 +1,36 @@
+import pytest
+from pgmob.sql import SQL, Identifier
+from pgmob import objects
+
+
+@pytest.mark.parametrize(
+    "obj_class, kind, attr, statement",
+    [
+        (objects.Function, "FUNCTION", "name", "RENAME TO"),
+        (objects.Function, "FUNCTION", "schema", "SET SCHEMA"),
+        (objects.Procedure, "PROCEDURE", "name", "RENAME TO"),
+        (objects.Procedure, "PROCEDURE", "schema", "SET SCHEMA"),
+        (objects.Table, "TABLE", "name", "RENAME TO"),
+        (objects.Table, "TABLE", "schema", "SET SCHEMA"),
+        (objects.Sequence, "SEQUENCE", "name", "RENAME TO"),
+        (objects.Sequence, "SEQUENCE", "schema", "SET SCHEMA"),
+        (objects.View, "VIEW", "name", "RENAME TO"),
+        (objects.View, "VIEW", "schema", "SET SCHEMA"),
+        (objects.Schema, "SCHEMA", "name", "RENAME TO"),
+        (objects.Role, "ROLE", "name", "RENAME TO"),
+    ],
+)
+def test_set_ephemeral_attr_twice(cluster, obj_class, kind, attr, statement):
+    obj = obj_class(cluster=cluster, name="foo")
+    fqn = obj._sql_fqn()
+    setattr(obj, attr, "tmpdoittwice")
+    setattr(obj, attr, "bar")
+    assert getattr(obj, attr) == "bar"
+    # only the last value is queued, and it still targets the object as it exists on the server
+    assert list(obj._changes.keys()) == [attr]
+    assert obj._changes[attr].sql == SQL(f"ALTER {kind} {{fqn}} {statement} {{value}}").format(
+        fqn=fqn, value=Identifier("bar")
+    )
+    # assigning the same value again is a no-op
+    setattr(obj, attr, "bar")
+    assert list(obj._changes.keys()) == [attr]
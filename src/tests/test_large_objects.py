@@ -10,6 +10,7 @@ from pgmob import objects
 def large_object_cursor(cursor, large_object_tuples):
     """Cursor that returns lo tuples"""
     cursor.fetchall.return_value = large_object_tuples
+    cursor.fetchmany.return_value = large_object_tuples
     return cursor
 
 
@@ -51,6 +52,12 @@ class TestLargeObject:
         large_object.write(b"new data")
         lobject.write.assert_called_with(b"new data")
 
+    def test_write_from(self, large_object: objects.LargeObject, lobject):
+        lobject.write.side_effect = len
+        large_object.write_from([b"a" * 20000, b"b" * 20000, b"c" * 10])
+        lobject.truncate.assert_called_with(0)
+        assert lobject.write.call_args_list == [call(b"a" * 20000 + b"b" * 20000), call(b"c" * 10)]
+
     def test_truncate(self, large_object: objects.LargeObject, lobject):
         large_object.truncate()
         lobject.truncate.assert_called_with(0)
@@ -102,3 +109,20 @@ class TestLargeObjectCollection:
         large_object_collection.refresh()
         assert large_object_collection[large_object_tuples[0].oid].owner == large_object_tuples[0].lomowner
         assert len(large_object_collection[large_object_tuples[0].oid]._changes) == 0
+
+    def test_refresh_in_transaction(
+        self,
+        large_object_collection: objects.LargeObjectCollection,
+        large_object_tuples,
+        psycopg2_connection,
+        large_object_cursor,
+    ):
+        psycopg2_connection.autocommit = False
+        psycopg2_connection.reset_mock()
+        large_object_cursor.fetchmany.reset_mock()
+        large_object_collection.refresh()
+        assert len(large_object_collection) == len(large_object_tuples)
+        # the caller's transaction is not streamed through a server-side cursor
+        assert "name" not in psycopg2_connection.cursor.call_args.kwargs
+        large_object_cursor.fetchmany.assert_not_called()
+        assert psycopg2_connection.autocommit is False
@@ -8,6 +8,7 @@ from pgmob import objects
 def table_cursor(cursor, table_tuples):
     """Cursor that returns table tuples"""
     cursor.fetchall.return_value = table_tuples
+    cursor.fetchmany.return_value = table_tuples
     return cursor
 
 
@@ -103,6 +104,19 @@ class TestTable:
             ]
         )
 
+    def test_alter_rename(self, table, table_cursor, table_tuples):
+        src = table_tuples[0]
+        table_cursor.fetchall.return_value = [src._replace(tablename="bar")]
+        table.name = "bar"
+        table.alter()
+        assert table.name == "bar"
+        assert table._sql_fqn() == SQL(".").join([Identifier(src.schemaname), Identifier("bar")])
+        table.owner = "foo"
+        assert table._changes["owner"].sql == SQL("ALTER TABLE {table} OWNER TO {owner}").format(
+            table=SQL(".").join([Identifier(src.schemaname), Identifier("bar")]),
+            owner=Identifier("foo"),
+        )
+
 
 class TestTableCollection:
     def test_init(self, table_tuples, table_collection):